@@ -0,0 +1,205 @@
+import sys
+import warnings
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from history import HISTORY_DB, connect, available_dates
+
+# Rolling baseline per well: median / MAD of the previous BASELINE_DAYS
+# snapshots (the current day is excluded so a dip can't pull its own baseline down)
+BASELINE_DAYS = 30
+MIN_BASELINE_DAYS = 7
+
+# A dip is flagged when the value is both MAD_THRESHOLD robust standard
+# deviations and MIN_DROP (fractionally) below the baseline
+MAD_THRESHOLD = 3.0
+MIN_DROP = 0.3
+MAD_SCALE = 1.4826  # MAD -> standard deviation for normally distributed data
+# Floor on the spread as a fraction of the baseline, so a flat history gives
+# a finite score (a MIN_DROP dip then scores MIN_DROP / MIN_SPREAD = 6)
+MIN_SPREAD = 0.05
+
+# Rows per block of baseline windows, bounding the window arrays to ~25 MB each
+WINDOW_BLOCK_ROWS = 100_000
+
+DIP_METRICS = ["Oil (MT)", "Gas (KCM)", "Condensate (MT)"]
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS well_anomalies (
+        "Production Date" TEXT NOT NULL,
+        "Well Id" TEXT NOT NULL,
+        "Anomaly Type" TEXT NOT NULL,
+        "Metric" TEXT NOT NULL,
+        "Asset" TEXT,
+        "Delivery Network Group" TEXT,
+        "Value" REAL,
+        "Baseline" REAL,
+        "Deviation" REAL,
+        "Score" REAL,
+        PRIMARY KEY ("Production Date", "Well Id", "Anomaly Type", "Metric")
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_well_anomalies_platform
+        ON well_anomalies ("Delivery Network Group", "Production Date");
+"""
+
+ANOMALY_COLUMNS = [
+    "Production Date", "Well Id", "Anomaly Type", "Metric", "Asset",
+    "Delivery Network Group", "Value", "Baseline", "Deviation", "Score",
+]
+
+
+def load_well_history(conn, start_date, end_date):
+    # Enough history before start_date to fill the first day's baseline window
+    return pd.read_sql_query(f"""
+        SELECT "Production Date", "Well Id", "Asset", "Delivery Network Group", "Flowing",
+               {", ".join(f'"{metric}"' for metric in DIP_METRICS)}
+        FROM well_daily
+        WHERE "Production Date" BETWEEN date(:start_date, :lookback) AND :end_date
+        ORDER BY "Well Id", "Production Date"
+    """, conn, params={
+        "start_date": start_date,
+        "end_date": end_date,
+        "lookback": f"-{2 * BASELINE_DAYS} days",
+    })
+
+
+def window_median_mad(values, positions):
+    """Median and MAD of each row's trailing BASELINE_DAYS window, within its well.
+
+    values are sorted by well and date; positions is each row's index within
+    its well, so windows never reach into the previous well. Rows with fewer
+    than MIN_BASELINE_DAYS non-NaN values in their window get NaN.
+    """
+    padded = np.concatenate([np.full(BASELINE_DAYS - 1, np.nan), values])
+    # Slot j of a window holds the row BASELINE_DAYS - 1 - j back
+    back = np.arange(BASELINE_DAYS - 1, -1, -1)
+    median = np.full(len(values), np.nan)
+    mad = np.full(len(values), np.nan)
+
+    for start in range(0, len(values), WINDOW_BLOCK_ROWS):
+        stop = min(start + WINDOW_BLOCK_ROWS, len(values))
+        windows = sliding_window_view(padded[start:stop + BASELINE_DAYS - 1], BASELINE_DAYS)
+        windows = np.where(back <= positions[start:stop, None], windows, np.nan)
+        enough = np.count_nonzero(~np.isnan(windows), axis=1) >= MIN_BASELINE_DAYS
+        with warnings.catch_warnings():
+            # All-NaN windows (first days of a well) are expected
+            warnings.simplefilter("ignore", RuntimeWarning)
+            block_median = np.nanmedian(windows, axis=1)
+            block_mad = np.nanmedian(np.abs(windows - block_median[:, None]), axis=1)
+        median[start:stop] = np.where(enough, block_median, np.nan)
+        mad[start:stop] = np.where(enough, block_mad, np.nan)
+
+    return median, mad
+
+
+def rolling_baselines(history_df):
+    """Add per-well rolling median / MAD baselines for each dip metric (vectorized per window)."""
+    df = history_df.sort_values(["Well Id", "Production Date"]).reset_index(drop=True)
+    wells = df["Well Id"]
+    positions = df.groupby(wells).cumcount().to_numpy()
+
+    for metric in DIP_METRICS:
+        previous = df.groupby(wells)[metric].shift(1).to_numpy(dtype=float)
+        df[f"{metric} Baseline"], df[f"{metric} MAD"] = window_median_mad(previous, positions)
+
+    df["Previously Flowing"] = df.groupby(wells)["Flowing"].shift(1)
+    return df
+
+
+def find_anomalies(baseline_df):
+    """Production dips against the rolling baseline, and flowing -> non-flowing transitions."""
+    events = []
+
+    for metric in DIP_METRICS:
+        value = baseline_df[metric]
+        baseline = baseline_df[f"{metric} Baseline"]
+        spread = (baseline_df[f"{metric} MAD"] * MAD_SCALE).clip(lower=baseline.abs() * MIN_SPREAD)
+        deviation = value - baseline
+        score = deviation / spread
+
+        # Days the well didn't flow are reported once, as a shut-in, not as dips
+        is_dip = (
+            (baseline_df["Flowing"] != 0)
+            & (baseline > 0)
+            & (score <= -MAD_THRESHOLD)
+            & (value <= baseline * (1 - MIN_DROP))
+        )
+        dips = baseline_df.loc[is_dip, ["Production Date", "Well Id", "Asset", "Delivery Network Group"]].copy()
+        dips["Anomaly Type"] = "Production Dip"
+        dips["Metric"] = metric
+        dips["Value"] = value[is_dip]
+        dips["Baseline"] = baseline[is_dip]
+        dips["Deviation"] = deviation[is_dip]
+        dips["Score"] = score[is_dip]
+        events.append(dips)
+
+    is_shut_in = (baseline_df["Previously Flowing"] == 1) & (baseline_df["Flowing"] == 0)
+    shut_ins = baseline_df.loc[is_shut_in, ["Production Date", "Well Id", "Asset", "Delivery Network Group"]].copy()
+    shut_ins["Anomaly Type"] = "Shut-in"
+    shut_ins["Metric"] = "Flowing"
+    shut_ins["Value"] = 0.0
+    shut_ins["Baseline"] = 1.0
+    shut_ins["Deviation"] = -1.0
+    events.append(shut_ins)
+
+    # Shut-ins carry no score; reindex fills it rather than concatenating an all-NA column
+    events = [event for event in events if not event.empty]
+    if not events:
+        return pd.DataFrame(columns=ANOMALY_COLUMNS)
+    return pd.concat(events, ignore_index=True).reindex(columns=ANOMALY_COLUMNS)
+
+
+def detect_anomalies(start_date, end_date=None, db_path=HISTORY_DB):
+    """Recompute anomalies for snapshot dates in [start_date, end_date] and store them."""
+    start_date = pd.Timestamp(start_date).strftime('%Y-%m-%d')
+    end_date = pd.Timestamp(end_date or start_date).strftime('%Y-%m-%d')
+
+    conn = connect(db_path)
+    conn.executescript(SCHEMA)
+
+    baseline_df = rolling_baselines(load_well_history(conn, start_date, end_date))
+    in_range = baseline_df["Production Date"].between(start_date, end_date)
+    anomalies_df = find_anomalies(baseline_df[in_range])
+
+    with conn:
+        conn.execute(
+            'DELETE FROM well_anomalies WHERE "Production Date" BETWEEN ? AND ?',
+            (start_date, end_date),
+        )
+        conn.executemany(
+            f'INSERT INTO well_anomalies VALUES ({", ".join("?" * len(ANOMALY_COLUMNS))})',
+            anomalies_df.astype(object).where(anomalies_df.notna(), None).itertuples(index=False),
+        )
+
+    conn.close()
+    return anomalies_df
+
+
+def load_anomalies(start_date, end_date, db_path=HISTORY_DB):
+    """Stored anomalies for a date range, most recent first."""
+    conn = connect(db_path)
+    conn.executescript(SCHEMA)
+    df = pd.read_sql_query("""
+        SELECT * FROM well_anomalies
+        WHERE "Production Date" BETWEEN ? AND ?
+        ORDER BY "Production Date" DESC, "Anomaly Type", "Score"
+    """, conn, params=(
+        pd.Timestamp(start_date).strftime('%Y-%m-%d'),
+        pd.Timestamp(end_date).strftime('%Y-%m-%d'),
+    ))
+    conn.close()
+    return df
+
+
+if __name__ == "__main__":
+    # Usage: python anomalies.py [start_date] [end_date]
+    # Without arguments, recomputes anomalies over all retained history.
+    dates = available_dates()
+    if not dates:
+        print("No daily history retained yet.")
+        sys.exit(0)
+    start = sys.argv[1] if len(sys.argv) > 1 else dates[0]
+    end = sys.argv[2] if len(sys.argv) > 2 else dates[-1]
+    found = detect_anomalies(start, end)
+    print(f"Stored {len(found)} anomalies between {start} and {end}.")
@@ -0,0 +1,87 @@
+import os
+import sys
+import time
+import tempfile
+import numpy as np
+import pandas as pd
+
+from history import (
+    retain_snapshot,
+    well_deltas,
+    platform_deltas,
+    flow_transitions,
+    rollup_children,
+    rollup_history,
+)
+from synthetic import synthetic_snapshot
+from partitions import write_partitions, federated_platform_deltas, federated_well_deltas
+
+# Multi-day comparison benchmark.
+#
+# Builds a synthetic daily history (default: 3000 wells x 180 days, enough
+# for a 90-day window and the window before it) and times the comparison
+# queries as of the last day, against the single history database and
+# against per-asset partitions (one asset vs all four), plus rollup cube
+# lookups at the top and bottom of the hierarchy.
+#
+# Usage: python bench_comparison.py [wells] [days] > bench_output.txt
+
+BUDGET = 1.0  # seconds per query
+
+
+def timed(label, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    flag = "" if elapsed <= BUDGET else "  (over budget)"
+    print(f"{label:<45} {elapsed:>8.3f}s  {len(result):>7,} rows{flag}")
+    return elapsed
+
+
+def main():
+    num_wells = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    num_days = int(sys.argv[2]) if len(sys.argv) > 2 else 180
+
+    rng = np.random.default_rng(42)
+    days = pd.date_range(end="2025-04-06", periods=num_days, freq="D")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "history.db")
+        partition_dir = os.path.join(tmp, "partitions")
+
+        start = time.perf_counter()
+        for day in days:
+            snapshot = synthetic_snapshot(num_wells, rng)
+            retain_snapshot(snapshot, day, db_path=db_path)
+            write_partitions(snapshot, day, partition_dir=partition_dir)
+        print(f"Ingested {num_wells:,} wells x {num_days} days in {time.perf_counter() - start:.1f}s\n")
+
+        on_date = days[-1]
+        # Well 0's branch of the synthetic hierarchy, down to its platform number
+        platform_path = ("ASSET-0", "AREA-0", "FIELD-00", "PLATFORM-00", "PN-000")
+        window_start = days[-90] if num_days >= 90 else days[0]
+        timings = [
+            timed("Well deltas, 7-day window", well_deltas, on_date, 7, db_path=db_path),
+            timed("Well deltas, 90-day window", well_deltas, on_date, 90, db_path=db_path),
+            timed("Flow transitions", flow_transitions, on_date, db_path=db_path),
+            timed("Platform deltas, 90 days x 7-day window", platform_deltas, window_start, on_date, 7, db_path=db_path),
+            timed("Platform deltas, 90 days x 90-day window", platform_deltas, window_start, on_date, 90, db_path=db_path),
+            timed("Rollup children, all assets", rollup_children, on_date, db_path=db_path),
+            timed("Rollup children, one platform number", rollup_children, on_date, platform_path, db_path=db_path),
+            timed("Rollup history, one platform number", rollup_history, platform_path, db_path=db_path),
+            timed("Federated well deltas, 1 asset", federated_well_deltas, on_date, 90,
+                  assets=["ASSET-0"], partition_dir=partition_dir),
+            timed("Federated well deltas, 4 assets", federated_well_deltas, on_date, 90,
+                  partition_dir=partition_dir),
+            timed("Federated platform deltas, 1 asset", federated_platform_deltas, window_start, on_date, 7,
+                  assets=["ASSET-0"], partition_dir=partition_dir),
+            timed("Federated platform deltas, 4 assets", federated_platform_deltas, window_start, on_date, 7,
+                  partition_dir=partition_dir),
+        ]
+
+    if max(timings) > BUDGET:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
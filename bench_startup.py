@@ -0,0 +1,106 @@
+import os
+import sys
+import json
+import subprocess
+
+# Startup / rerun timing benchmark for the dashboard.
+#
+# Each page is measured in a fresh interpreter that starts directly on that
+# page (preselected through session state), so nothing else is rendered or
+# imported first:
+#   - cold start:     process start -> first script run of the page finished
+#   - first chart:    that first script run alone (imports the view module,
+#                     plotly and loads the page's data)
+#   - rerun:          median of repeated reruns of the same page
+# The worker also checks that only the selected page's view module was
+# imported, i.e. that the app shell keeps the other pages off the startup path.
+#
+# Usage: python bench_startup.py [reruns] > bench_output.txt
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Upper bounds (seconds) we hold the numbers to; exceeding one is reported.
+BUDGETS = {
+    "cold_start": 5.0,
+    "first_chart": 3.0,
+    "rerun": 0.5,
+}
+
+WORKER = """
+import sys, json, time, statistics
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+
+from views import PAGES
+
+page, reruns = sys.argv[1], int(sys.argv[2])
+at = AppTest.from_file("app.py", default_timeout=120)
+at.session_state["page"] = page
+
+t1 = time.perf_counter()
+at.run()
+first_chart = time.perf_counter() - t1
+cold_start = time.perf_counter() - t0
+if at.exception:
+    raise SystemExit(at.exception[0].value)
+
+rerun_times = []
+for _ in range(reruns):
+    t2 = time.perf_counter()
+    at.run()
+    rerun_times.append(time.perf_counter() - t2)
+
+errors = [e.value for e in at.error]
+other_views = [name for name in PAGES.values() if name in sys.modules and name != PAGES[page]]
+if other_views:
+    errors.append(f"other page modules were imported: {', '.join(other_views)}")
+print(json.dumps({
+    "cold_start": cold_start,
+    "first_chart": first_chart,
+    "rerun": statistics.median(rerun_times),
+    "page": at.sidebar.radio[0].value,
+    "errors": errors,
+}))
+"""
+
+
+def run_page(page, reruns):
+    result = subprocess.run(
+        [sys.executable, "-c", WORKER, page, str(reruns)],
+        cwd=APP_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    reruns = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    sys.path.insert(0, APP_DIR)
+    from views import PAGES
+
+    print(f"{'Page':<40} {'cold start':>11} {'first chart':>12} {'rerun':>8}")
+    over_budget = []
+    for page in PAGES:
+        timings = run_page(page, reruns)
+        print(f"{page:<40} {timings['cold_start']:>10.3f}s {timings['first_chart']:>11.3f}s {timings['rerun']:>7.3f}s")
+        if timings["page"] != page:
+            timings["errors"].append(f"rendered {timings['page']!r} instead")
+        for error in timings["errors"]:
+            print(f"    error: {error}")
+            over_budget.append(f"{page}: {error}")
+        for key, budget in BUDGETS.items():
+            if timings[key] > budget:
+                over_budget.append(f"{page}: {key} {timings[key]:.3f}s > {budget:.1f}s")
+
+    if over_budget:
+        print("\nFailed checks:")
+        for line in over_budget:
+            print(f"  {line}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
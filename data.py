@@ -0,0 +1,145 @@
+import os
+import streamlit as st
+import pandas as pd
+import sqlite3
+import numpy as np
+import math
+from datetime import datetime, timedelta, date
+
+# Replace with your actual database path
+WELLPROD_DB = 'petro-wellprod-06042025.db'
+
+# Changes when the database is re-imported; keys shared page computations
+def data_version():
+    return os.path.getmtime(WELLPROD_DB) if os.path.exists(WELLPROD_DB) else 0
+
+# Function to load the delivery network summary from SQLite database.
+# version (data_version()) is only a cache key, so a re-import reloads.
+@st.cache_data
+def load_delivery_network_data(version):
+    conn = sqlite3.connect(WELLPROD_DB)
+
+    # Query for delivery network data with well counts
+    delivery_network_df = pd.read_sql_query("""
+        SELECT
+            "Process Platform/CTF" AS "Delivery Network Group",
+            SUM("Allocated Oil ProductionMT") AS "Oil (MT)",
+            SUM("Allocated Gas ProductionKCM") AS "Gas (KCM)",
+            SUM("Allocated Condensate ProductionMT") AS "Condensate (MT)",
+            SUM("Allocated Water ProductionBB6") AS "Water (BB6)",
+            COUNT(CASE WHEN "Hrs Flown" > 0 THEN 1 END) as "Flowing Wells",
+            COUNT(CASE WHEN "Hrs Flown" = 0 THEN 1 END) as "Non-Flowing Wells",
+            COUNT(*) as "Total Wells"
+        FROM production
+        WHERE "Process Platform/CTF" IS NOT NULL
+        GROUP BY "Process Platform/CTF"
+        ORDER BY "Gas (KCM)" DESC
+    """, conn)
+
+    conn.close()
+
+    delivery_network_df['Total Wells'] = delivery_network_df['Flowing Wells'] + delivery_network_df['Non-Flowing Wells']
+    delivery_network_df = delivery_network_df.fillna(0)
+
+    return delivery_network_df
+
+# Function to load all production data (full details), only needed by well-level views.
+# Cached per data version, like load_delivery_network_data().
+@st.cache_data
+def load_production_data(version):
+    conn = sqlite3.connect(WELLPROD_DB)
+
+    production_df = pd.read_sql_query("""
+        SELECT * FROM production
+    """, conn)
+
+    conn.close()
+
+    return production_df
+
+# Function to generate time series data for simulation.
+# Cached per date range so that widget reruns reuse the same simulated series.
+@st.cache_data
+def generate_time_series_data(delivery_network_df, start_date=None, end_date=None):
+    networks = delivery_network_df['Delivery Network Group'].tolist()
+
+    # Create a dictionary of base values for each network
+    base_values = {}
+    for _, row in delivery_network_df.iterrows():
+        network = row['Delivery Network Group']
+        base_values[network] = {
+            'gas': row['Gas (KCM)'],
+            'oil': row['Oil (MT)'],
+            'condensate': row['Condensate (MT)'],
+            'water': row['Water (BB6)']
+        }
+
+    # Generate 24 months of data starting from 24 months ago (to allow for date range selection)
+    today = datetime.now()
+
+    time_series_data = []
+
+    # Generate data for each month in the 24-month period
+    current_date = datetime(today.year - 2, today.month, 1)
+    i = 0
+
+    while current_date <= today:
+        month_name = current_date.strftime('%b %Y')
+        date_obj = current_date.date()
+
+        month_data = {
+            'month': month_name,
+            'month_num': i,
+            'date': date_obj
+        }
+
+        for network in networks:
+            # Add some random variation and seasonal pattern
+            variation_factor = 0.8 + np.random.random() * 0.4  # Random between 0.8 and 1.2
+            seasonal_factor = 1 + math.sin(i / 12 * 2 * math.pi) * 0.15  # Seasonal pattern
+
+            for product in ['gas', 'oil', 'condensate', 'water']:
+                base_value = base_values[network][product]
+                adjusted_value = base_value * variation_factor * seasonal_factor
+                month_data[f"{network}_{product}"] = round(adjusted_value, 2)
+
+        time_series_data.append(month_data)
+        current_date = current_date + timedelta(days=30)
+        i += 1
+
+    df = pd.DataFrame(time_series_data)
+
+    # Filter by date range if provided
+    if start_date is not None and end_date is not None:
+        start_date_obj = start_date if isinstance(start_date, date) else start_date.date()
+        end_date_obj = end_date if isinstance(end_date, date) else end_date.date()
+        df = df[(df['date'] >= start_date_obj) & (df['date'] <= end_date_obj)]
+
+    return df
+
+# Date range selector in sidebar (for time series views)
+def select_date_range():
+    st.sidebar.title("Date Range")
+
+    # Calculate default date range (last 12 months)
+    today = datetime.now()
+    default_start = datetime(today.year - 1, today.month, 1)
+    default_end = today
+
+    start_date = st.sidebar.date_input(
+        "Select Start Date",
+        value=default_start,
+        min_value=datetime(today.year - 2, 1, 1),
+        max_value=today,
+        help="Choose the start date for the data range"
+    )
+
+    end_date = st.sidebar.date_input(
+        "Select End Date",
+        value=default_end,
+        min_value=start_date,
+        max_value=today,
+        help="Choose the end date for the data range"
+    )
+
+    return start_date, end_date
@@ -0,0 +1,579 @@
+import os
+import sqlite3
+import pandas as pd
+
+# Daily snapshots are retained here, one "Production Date" per ingested file
+HISTORY_DB = 'petro-wellprod-history.db'
+
+# Display name -> source column, matching the delivery network summary
+VOLUME_COLUMNS = {
+    "Oil (MT)": "Allocated Oil ProductionMT",
+    "Gas (KCM)": "Allocated Gas ProductionKCM",
+    "Condensate (MT)": "Allocated Condensate ProductionMT",
+    "Water (BB6)": "Allocated Water ProductionBB6",
+}
+
+# Running totals kept per well so any window sum is a difference of two rows
+CUMULATIVE_COLUMNS = [*VOLUME_COLUMNS, "Flowing"]
+
+# Drill-down hierarchy of the rollup cube: cube column -> source expression.
+# Level n of the cube holds one row per distinct path of the first n columns
+# (level 0 is the grand total); columns below a row's level are ''.
+ROLLUP_HIERARCHY = {
+    "Asset": '"Asset"',
+    "Area": '"Area"',
+    "Field": '"Field"',
+    "Delivery Network Group": '"Process Platform/CTF"',
+    "Platform No": '"Platform No"',
+    "Well Id": 'COALESCE("Well Id", "Well String")',
+}
+ROLLUP_LEVELS = list(ROLLUP_HIERARCHY)
+UNASSIGNED = 'UNASSIGNED'
+
+# well_daily / platform_daily are keyed by date first so one day (or a date
+# range) is a primary key seek; the secondary indexes serve per-well /
+# per-platform lookups such as "latest snapshot on or before a date".
+# well_carry_in holds each well's last well_daily row from before the first
+# snapshot in the file; it is empty except in monthly partitions.
+# rollup_daily is keyed by date, level and hierarchy path, so the children of
+# any node are one primary key range; idx_rollup_daily_node serves a node's
+# history across days.
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS well_daily (
+        "Production Date" TEXT NOT NULL,
+        "Well Id" TEXT NOT NULL,
+        "Asset" TEXT,
+        "Area" TEXT,
+        "Field" TEXT,
+        "Delivery Network Group" TEXT,
+        "Platform No" TEXT,
+        "Hrs Flown" REAL,
+        "Oil (MT)" REAL,
+        "Gas (KCM)" REAL,
+        "Condensate (MT)" REAL,
+        "Water (BB6)" REAL,
+        "Flowing" INTEGER,
+        "Cum Oil (MT)" REAL,
+        "Cum Gas (KCM)" REAL,
+        "Cum Condensate (MT)" REAL,
+        "Cum Water (BB6)" REAL,
+        "Cum Flowing" INTEGER,
+        PRIMARY KEY ("Production Date", "Well Id")
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_well_daily_well
+        ON well_daily ("Well Id", "Production Date");
+
+    CREATE TABLE IF NOT EXISTS platform_daily (
+        "Production Date" TEXT NOT NULL,
+        "Delivery Network Group" TEXT NOT NULL,
+        "Oil (MT)" REAL,
+        "Gas (KCM)" REAL,
+        "Condensate (MT)" REAL,
+        "Water (BB6)" REAL,
+        "Flowing Wells" INTEGER,
+        "Non-Flowing Wells" INTEGER,
+        "Total Wells" INTEGER,
+        PRIMARY KEY ("Production Date", "Delivery Network Group")
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_platform_daily_platform
+        ON platform_daily ("Delivery Network Group", "Production Date");
+
+    CREATE TABLE IF NOT EXISTS rollup_daily (
+        "Production Date" TEXT NOT NULL,
+        "Level" INTEGER NOT NULL,
+        "Asset" TEXT NOT NULL,
+        "Area" TEXT NOT NULL,
+        "Field" TEXT NOT NULL,
+        "Delivery Network Group" TEXT NOT NULL,
+        "Platform No" TEXT NOT NULL,
+        "Well Id" TEXT NOT NULL,
+        "Oil (MT)" REAL,
+        "Gas (KCM)" REAL,
+        "Condensate (MT)" REAL,
+        "Water (BB6)" REAL,
+        "Flowing Wells" INTEGER,
+        "Non-Flowing Wells" INTEGER,
+        "Total Wells" INTEGER,
+        PRIMARY KEY ("Production Date", "Level", "Asset", "Area", "Field",
+                     "Delivery Network Group", "Platform No", "Well Id")
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_rollup_daily_node
+        ON rollup_daily ("Level", "Asset", "Area", "Field",
+                         "Delivery Network Group", "Platform No", "Well Id", "Production Date");
+
+    CREATE TABLE IF NOT EXISTS well_carry_in (
+        "Production Date" TEXT NOT NULL,
+        "Well Id" TEXT NOT NULL PRIMARY KEY,
+        "Asset" TEXT,
+        "Area" TEXT,
+        "Field" TEXT,
+        "Delivery Network Group" TEXT,
+        "Platform No" TEXT,
+        "Hrs Flown" REAL,
+        "Oil (MT)" REAL,
+        "Gas (KCM)" REAL,
+        "Condensate (MT)" REAL,
+        "Water (BB6)" REAL,
+        "Flowing" INTEGER,
+        "Cum Oil (MT)" REAL,
+        "Cum Gas (KCM)" REAL,
+        "Cum Condensate (MT)" REAL,
+        "Cum Water (BB6)" REAL,
+        "Cum Flowing" INTEGER
+    ) WITHOUT ROWID;
+"""
+
+
+def connect(db_path=HISTORY_DB):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def history_version(db_path=HISTORY_DB):
+    # Changes whenever a snapshot is ingested; used to key cached results
+    return os.path.getmtime(db_path) if os.path.exists(db_path) else 0
+
+
+def date_str(value):
+    # Snapshot dates are stored as 'YYYY-MM-DD' text everywhere
+    return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+def _latest_on_or_before(alias, bound):
+    # Latest retained snapshot date of the current well, served by idx_well_daily_well
+    return f"""(
+        SELECT MAX(p."Production Date") FROM well_daily p
+        WHERE p."Well Id" = {alias}."Well Id" AND p."Production Date" {bound}
+    )"""
+
+
+def _refresh_cumulative(conn, snapshot_date):
+    # Rebuild running totals from snapshot_date onwards: the total carried in
+    # from each well's previous snapshot (or well_carry_in, before its first
+    # one) plus a running SUM window. Normally that is just the new day;
+    # back-filling an older day also fixes later days.
+    running = ",\n".join(
+        f'COALESCE(b."Cum {column}", 0) + SUM(COALESCE(d."{column}", 0)) OVER w AS "Cum {column}"'
+        for column in CUMULATIVE_COLUMNS
+    )
+    assignments = ",\n".join(
+        f'"Cum {column}" = r."Cum {column}"' for column in CUMULATIVE_COLUMNS
+    )
+    carried = ", ".join(
+        f'COALESCE(b."Cum {column}", c."Cum {column}") AS "Cum {column}"' for column in CUMULATIVE_COLUMNS
+    )
+    conn.execute(f"""
+        WITH recent AS MATERIALIZED (
+            SELECT * FROM well_daily WHERE "Production Date" >= :snapshot_date
+        ),
+        carried AS MATERIALIZED (
+            SELECT w."Well Id", {carried}
+            FROM (SELECT DISTINCT "Well Id" FROM recent) w
+            LEFT JOIN well_daily b
+              ON b."Production Date" = {_latest_on_or_before('w', '< :snapshot_date')}
+             AND b."Well Id" = w."Well Id"
+            LEFT JOIN well_carry_in c ON c."Well Id" = w."Well Id"
+        )
+        UPDATE well_daily SET
+            {assignments}
+        FROM (
+            SELECT
+                d."Production Date",
+                d."Well Id",
+                {running}
+            FROM recent d
+            LEFT JOIN carried b ON b."Well Id" = d."Well Id"
+            WINDOW w AS (PARTITION BY d."Well Id" ORDER BY d."Production Date" ROWS UNBOUNDED PRECEDING)
+        ) AS r
+        WHERE well_daily."Production Date" = r."Production Date"
+          AND well_daily."Well Id" = r."Well Id"
+    """, {"snapshot_date": snapshot_date})
+
+
+def _build_rollup(conn, snapshot_date):
+    # Well level from the day's raw rows (counted per row, like the delivery
+    # network summary), then each coarser level summed from the one below it.
+    # Rows without a well are the sheet's platform subtotals and grand total;
+    # rolling those up as well would count every volume twice.
+    counts = [
+        'COUNT(CASE WHEN "Hrs Flown" > 0 THEN 1 END)',
+        'COUNT(CASE WHEN "Hrs Flown" = 0 THEN 1 END)',
+        'COUNT(CASE WHEN "Hrs Flown" > 0 THEN 1 END) + COUNT(CASE WHEN "Hrs Flown" = 0 THEN 1 END)',
+    ]
+    # A missing or blank level is UNASSIGNED; '' would read as "below this row's level"
+    keys = [f"CAST(COALESCE(NULLIF({source}, ''), '{UNASSIGNED}') AS TEXT)" for source in ROLLUP_HIERARCHY.values()]
+    volume_sums = [f'SUM("{source}")' for source in VOLUME_COLUMNS.values()]
+    conn.execute(f"""
+        INSERT INTO rollup_daily
+        SELECT "Production Date", {len(ROLLUP_LEVELS)}, {", ".join(keys + volume_sums + counts)}
+        FROM production_history
+        WHERE "Production Date" = ?
+          AND {ROLLUP_HIERARCHY["Well Id"]} IS NOT NULL
+        GROUP BY "Production Date", {", ".join(keys)}
+    """, (snapshot_date,))
+
+    totals = [f'SUM("{column}")' for column in [*VOLUME_COLUMNS, "Flowing Wells", "Non-Flowing Wells", "Total Wells"]]
+    for level in range(len(ROLLUP_LEVELS) - 1, -1, -1):
+        group_keys = [f'"{column}"' for column in ROLLUP_LEVELS[:level]]
+        blank_keys = ["''"] * (len(ROLLUP_LEVELS) - level)
+        # Grouping by the date as well means an empty day inserts no total row
+        conn.execute(f"""
+            INSERT INTO rollup_daily
+            SELECT "Production Date", {level}, {", ".join(group_keys + blank_keys + totals)}
+            FROM rollup_daily
+            WHERE "Production Date" = ? AND "Level" = ?
+            GROUP BY {", ".join(['"Production Date"', *group_keys])}
+        """, (snapshot_date, level + 1))
+
+
+def retain_snapshot(snapshot_df, snapshot_date, db_path=HISTORY_DB, carry_in=None):
+    """Store one day's production snapshot, replacing any earlier load of the same day.
+
+    carry_in, if given, replaces each well's snapshot from before the file
+    (well_daily rows, one per well, as returned by closing_snapshots()).
+    """
+    snapshot_date = date_str(snapshot_date)
+    conn = connect(db_path)
+
+    with conn:
+        refresh_from = snapshot_date
+        if carry_in is not None:
+            conn.execute('DELETE FROM well_carry_in')
+            carry_in.to_sql('well_carry_in', conn, if_exists='append', index=False)
+            # Every running total in the file starts from the carry-in
+            refresh_from = min(snapshot_date, conn.execute(
+                'SELECT COALESCE(MIN("Production Date"), ?) FROM well_daily', (snapshot_date,)
+            ).fetchone()[0])
+
+        has_raw = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'production_history'"
+        ).fetchone()
+        if has_raw:
+            conn.execute('DELETE FROM production_history WHERE "Production Date" = ?', (snapshot_date,))
+        conn.execute('DELETE FROM well_daily WHERE "Production Date" = ?', (snapshot_date,))
+        conn.execute('DELETE FROM platform_daily WHERE "Production Date" = ?', (snapshot_date,))
+        conn.execute('DELETE FROM rollup_daily WHERE "Production Date" = ?', (snapshot_date,))
+
+        # Raw rows, as imported from Excel, tagged with the snapshot date
+        snapshot_df.assign(**{"Production Date": snapshot_date}).to_sql(
+            'production_history', conn, if_exists='append', index=False
+        )
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_production_history_date
+                ON production_history ("Production Date")
+        """)
+
+        volume_sums = ",\n".join(
+            f'SUM("{source}") AS "{name}"' for name, source in VOLUME_COLUMNS.items()
+        )
+
+        # One row per well per day; a well is flowing if any of its strings flowed
+        conn.execute(f"""
+            INSERT INTO well_daily (
+                "Production Date", "Well Id", "Asset", "Area", "Field",
+                "Delivery Network Group", "Platform No", "Hrs Flown",
+                "Oil (MT)", "Gas (KCM)", "Condensate (MT)", "Water (BB6)", "Flowing"
+            )
+            SELECT
+                "Production Date",
+                COALESCE("Well Id", "Well String") AS "Well Id",
+                MAX("Asset"),
+                MAX("Area"),
+                MAX("Field"),
+                MAX("Process Platform/CTF"),
+                MAX("Platform No"),
+                MAX("Hrs Flown"),
+                {volume_sums},
+                CASE WHEN MAX("Hrs Flown") > 0 THEN 1 WHEN MAX("Hrs Flown") = 0 THEN 0 END
+            FROM production_history
+            WHERE "Production Date" = ?
+              AND COALESCE("Well Id", "Well String") IS NOT NULL
+            GROUP BY COALESCE("Well Id", "Well String")
+        """, (snapshot_date,))
+        _refresh_cumulative(conn, refresh_from)
+
+        # Same aggregation as the dashboard's delivery network summary, but
+        # without the sheet's subtotal rows (no well), which would double volumes
+        conn.execute(f"""
+            INSERT INTO platform_daily
+            SELECT
+                "Production Date",
+                "Process Platform/CTF",
+                {volume_sums},
+                COUNT(CASE WHEN "Hrs Flown" > 0 THEN 1 END),
+                COUNT(CASE WHEN "Hrs Flown" = 0 THEN 1 END),
+                COUNT(CASE WHEN "Hrs Flown" > 0 THEN 1 END) + COUNT(CASE WHEN "Hrs Flown" = 0 THEN 1 END)
+            FROM production_history
+            WHERE "Production Date" = ?
+              AND "Process Platform/CTF" IS NOT NULL
+              AND COALESCE("Well Id", "Well String") IS NOT NULL
+            GROUP BY "Process Platform/CTF"
+        """, (snapshot_date,))
+
+        _build_rollup(conn, snapshot_date)
+
+    conn.close()
+
+
+def closing_snapshots(db_path=HISTORY_DB):
+    """Each well's last well_daily row in db_path, running totals included.
+
+    Wells only in the file's carry-in keep their carried row, so chaining
+    files (monthly partitions) never drops a well.
+    """
+    return read_query(f"""
+        SELECT d.*
+        FROM (SELECT DISTINCT "Well Id" FROM well_daily) w
+        JOIN well_daily d
+          ON d."Production Date" = {_latest_on_or_before('w', 'IS NOT NULL')}
+         AND d."Well Id" = w."Well Id"
+        UNION ALL
+        SELECT * FROM well_carry_in c
+        WHERE NOT EXISTS (SELECT 1 FROM well_daily d WHERE d."Well Id" = c."Well Id")
+    """, None, db_path=db_path)
+
+
+def available_dates(db_path=HISTORY_DB):
+    if not os.path.exists(db_path):
+        return []
+    conn = connect(db_path)
+    dates = [row[0] for row in conn.execute(
+        'SELECT DISTINCT "Production Date" FROM platform_daily ORDER BY "Production Date"'
+    )]
+    conn.close()
+    return dates
+
+
+def read_query(query, params, db_path=HISTORY_DB):
+    conn = connect(db_path)
+    df = pd.read_sql_query(query, conn, params=params)
+    conn.close()
+    return df
+
+
+def well_deltas_query(on_date, window_days=7):
+    """SQL and parameters for well_deltas(); reads well_daily and well_carry_in."""
+    # Each earlier snapshot is looked up in well_daily, or in well_carry_in when
+    # it precedes the file (monthly partitions; empty in the single database)
+    def earlier(alias, column, default=''):
+        return f'COALESCE({alias}."{column}", c{alias}."{column}"{default})'
+
+    select = [
+        'cur."Production Date"',
+        'cur."Well Id"',
+        'cur."Asset"',
+        'cur."Delivery Network Group"',
+        'cur."Hrs Flown"',
+        'cur."Flowing"',
+        'cur.previous_date AS "Previous Date"',
+        f'{earlier("prev", "Flowing")} AS "Previously Flowing"',
+    ]
+    for column in VOLUME_COLUMNS:
+        select.append(f'cur."{column}"')
+        select.append(f'cur."{column}" - {earlier("prev", column)} AS "{column} DoD Change"')
+    # The prior window holds a snapshot only if the latest one on or before its
+    # end is later than the latest one on or before its start; otherwise the
+    # change is NULL, as the platform RANGE frame gives
+    has_prior = 'cur.window_start IS NOT NULL AND cur.window_start IS NOT cur.prior_start'
+    for column in CUMULATIVE_COLUMNS:
+        window_sum = f'(cur."Cum {column}" - {earlier("ws", f"Cum {column}", ", 0")})'
+        prior_sum = f'({earlier("ws", f"Cum {column}")} - {earlier("ps", f"Cum {column}", ", 0")})'
+        label = "Flowing Days" if column == "Flowing" else column
+        select.append(f'{window_sum} AS "{label} Window Sum"')
+        select.append(f'CASE WHEN {has_prior} THEN {window_sum} - {prior_sum} END AS "{label} Window Change"')
+    select_sql = ",\n            ".join(select)
+
+    def latest(bound):
+        return f"""COALESCE(
+                    {_latest_on_or_before('c', bound)},
+                    CASE WHEN ci."Production Date" {bound} THEN ci."Production Date" END
+                )"""
+
+    joins = "\n        ".join(
+        f'LEFT JOIN well_daily {alias} ON {alias}."Production Date" = cur.{date} AND {alias}."Well Id" = cur."Well Id"\n'
+        f'        LEFT JOIN well_carry_in c{alias} ON c{alias}."Production Date" = cur.{date} AND c{alias}."Well Id" = cur."Well Id"'
+        for alias, date in [("prev", "previous_date"), ("ws", "window_start"), ("ps", "prior_start")]
+    )
+
+    query = f"""
+        WITH cur AS (
+            SELECT
+                c.*,
+                {latest('< :on_date')} AS previous_date,
+                {latest('<= date(:on_date, :window_offset)')} AS window_start,
+                {latest('<= date(:on_date, :prior_offset)')} AS prior_start
+            FROM well_daily c
+            LEFT JOIN well_carry_in ci ON ci."Well Id" = c."Well Id"
+            WHERE c."Production Date" = :on_date
+        )
+        SELECT
+            {select_sql}
+        FROM cur
+        {joins}
+        ORDER BY cur."Delivery Network Group", cur."Well Id"
+    """
+    params = {
+        "on_date": date_str(on_date),
+        "window_offset": f"-{window_days} days",
+        "prior_offset": f"-{2 * window_days} days",
+    }
+    return query, params
+
+
+def well_deltas(on_date, window_days=7, db_path=HISTORY_DB):
+    """Per-well change since the previous snapshot and over the trailing window, as of on_date.
+
+    The window covers (on_date - window_days, on_date] and is compared with the
+    window before it; the change is NULL when that window has no snapshot.
+    Sums come from the running totals, so the cost is a few keyed lookups per
+    well regardless of the window length.
+    """
+    return read_query(*well_deltas_query(on_date, window_days), db_path=db_path)
+
+
+def platform_deltas_query(start_date, end_date, window_days=7):
+    """SQL and parameters for platform_deltas(); reads platform_daily only."""
+    columns = [*VOLUME_COLUMNS, "Flowing Wells", "Non-Flowing Wells"]
+    select = ['"Production Date"', '"Delivery Network Group"', '"Total Wells"']
+    select += [f'"{column}"' for column in columns]
+    select.append('LAG("Production Date") OVER w AS "Previous Date"')
+    for column in columns:
+        select.append(f'"{column}" - LAG("{column}") OVER w AS "{column} DoD Change"')
+    for column in columns:
+        select.append(f'SUM("{column}") OVER rolling AS "{column} Window Sum"')
+        select.append(f'SUM("{column}") OVER rolling - SUM("{column}") OVER prior AS "{column} Window Change"')
+    select_sql = ",\n                ".join(select)
+
+    query = f"""
+        SELECT * FROM (
+            SELECT
+                {select_sql}
+            FROM (
+                SELECT *, CAST(julianday("Production Date") AS INTEGER) AS day
+                FROM (
+                    SELECT * FROM platform_daily
+                    WHERE "Production Date" BETWEEN date(:start_date, :lookback) AND :end_date
+                    UNION ALL
+                    -- Each platform's last snapshot before the lookback, so LAG
+                    -- finds the previous snapshot however old it is (as
+                    -- well_deltas does); it is outside every RANGE frame.
+                    SELECT b.* FROM (SELECT DISTINCT "Delivery Network Group" FROM platform_daily) g
+                    JOIN platform_daily b
+                      ON b."Delivery Network Group" = g."Delivery Network Group"
+                     AND b."Production Date" = (
+                        SELECT MAX(p."Production Date") FROM platform_daily p
+                        WHERE p."Delivery Network Group" = g."Delivery Network Group"
+                          AND p."Production Date" < date(:start_date, :lookback)
+                     )
+                )
+            )
+            WINDOW
+                w AS (PARTITION BY "Delivery Network Group" ORDER BY day),
+                rolling AS (PARTITION BY "Delivery Network Group" ORDER BY day
+                            RANGE BETWEEN :window_back PRECEDING AND CURRENT ROW),
+                prior AS (PARTITION BY "Delivery Network Group" ORDER BY day
+                          RANGE BETWEEN :prior_back PRECEDING AND :window_days PRECEDING)
+        )
+        WHERE "Production Date" >= :start_date
+        ORDER BY "Production Date", "Delivery Network Group"
+    """
+    params = {
+        "start_date": date_str(start_date),
+        "end_date": date_str(end_date),
+        # Two full windows before the start so the first day's deltas are complete
+        "lookback": f"-{2 * window_days} days",
+        "window_days": window_days,
+        "window_back": window_days - 1,
+        "prior_back": 2 * window_days - 1,
+    }
+    return query, params
+
+
+def platform_deltas(start_date, end_date, window_days=7, db_path=HISTORY_DB):
+    """Per-platform day-over-day and rolling window deltas for every day in the range.
+
+    Day-over-day compares with the previous retained snapshot (LAG), however far
+    back it is; the rolling windows are RANGE frames over the day number so gaps
+    in the history don't shift them. A window change is NULL when the prior
+    window has no snapshot, as in well_deltas().
+    """
+    return read_query(*platform_deltas_query(start_date, end_date, window_days), db_path=db_path)
+
+
+def transitions_from_deltas(deltas):
+    """Rows of a well_deltas() result whose flowing state changed."""
+    changed = deltas[
+        deltas["Previously Flowing"].notna()
+        & deltas["Flowing"].notna()
+        & (deltas["Previously Flowing"] != deltas["Flowing"])
+    ].copy()
+    changed["Transition"] = changed["Flowing"].map({0: "Stopped Flowing", 1: "Started Flowing"})
+    return changed
+
+
+def flow_transitions(on_date, db_path=HISTORY_DB):
+    """Wells whose flowing state changed since their previous retained snapshot."""
+    return transitions_from_deltas(well_deltas(on_date, window_days=1, db_path=db_path))
+
+
+def rebuild_rollup(db_path=HISTORY_DB):
+    """Rebuild the rollup cube for every retained day, e.g. days retained before it existed."""
+    conn = connect(db_path)
+    with conn:
+        conn.execute('DELETE FROM rollup_daily')
+        dates = [row[0] for row in conn.execute(
+            'SELECT DISTINCT "Production Date" FROM platform_daily ORDER BY "Production Date"'
+        )]
+        for snapshot_date in dates:
+            _build_rollup(conn, snapshot_date)
+    conn.close()
+
+
+def _rollup_conditions(path, level):
+    # The path so far, e.g. ("BASSEIN", "AREA-1"), at level len(path) (the node
+    # itself) or len(path) + 1 (its children)
+    if len(path) > len(ROLLUP_LEVELS):
+        raise ValueError(f"Rollup paths have at most {len(ROLLUP_LEVELS)} levels: {path}")
+    conditions = ['"Level" = ?'] + [f'"{column}" = ?' for column in ROLLUP_LEVELS[:len(path)]]
+    return conditions, [level, *map(str, path)]
+
+
+def rollup_node(on_date, path=(), db_path=HISTORY_DB):
+    """The rollup row for one hierarchy node on on_date (path () is the grand total)."""
+    conditions, params = _rollup_conditions(path, len(path))
+    return read_query(
+        f'SELECT * FROM rollup_daily WHERE "Production Date" = ? AND {" AND ".join(conditions)}',
+        [date_str(on_date), *params],
+        db_path=db_path,
+    )
+
+
+def rollup_children(on_date, path=(), db_path=HISTORY_DB):
+    """Rollup rows one level below path on on_date, e.g. the areas of an asset.
+
+    A primary key range on (date, level, path), so the cost depends on the
+    number of children only, not on the number of raw rows below them.
+    """
+    if len(path) == len(ROLLUP_LEVELS):
+        # Wells are the leaves
+        return rollup_node(on_date, path, db_path).iloc[0:0]
+    conditions, params = _rollup_conditions(path, len(path) + 1)
+    return read_query(
+        f'SELECT * FROM rollup_daily WHERE "Production Date" = ? AND {" AND ".join(conditions)} '
+        f'ORDER BY "{ROLLUP_LEVELS[len(path)]}"',
+        [date_str(on_date), *params],
+        db_path=db_path,
+    )
+
+
+def rollup_history(path=(), db_path=HISTORY_DB):
+    """One hierarchy node across every retained day, served by idx_rollup_daily_node."""
+    conditions, params = _rollup_conditions(path, len(path))
+    # Columns below the node are '' so the whole index prefix is bound
+    conditions += [f'"{column}" = \'\'' for column in ROLLUP_LEVELS[len(path):]]
+    return read_query(
+        f'SELECT * FROM rollup_daily WHERE {" AND ".join(conditions)} ORDER BY "Production Date"',
+        params,
+        db_path=db_path,
+    )
@@ -1,8 +1,18 @@
+import os
 import pandas as pd
 import sqlite3
+from datetime import datetime
+
+from history import retain_snapshot
+from anomalies import detect_anomalies
+from partitions import write_partitions
+
+EXCEL_PATH = 'data/wellprod 06.04.25 mt.XLSX'
+# The snapshot date is in the file name as dd.mm.yy
+SNAPSHOT_DATE = datetime.strptime(os.path.basename(EXCEL_PATH).split()[1], '%d.%m.%y').strftime('%Y-%m-%d')
 
 # Load Excel file (make sure to use openpyxl engine for .xlsx)
-df = pd.read_excel('data/wellprod 06.04.25 mt.XLSX', engine='openpyxl')
+df = pd.read_excel(EXCEL_PATH, engine='openpyxl')
 # Connect to SQLite database (creates file if it doesn't exist)
 conn = sqlite3.connect('petro-wellprod-06042025.db')
 
@@ -11,3 +21,17 @@ df.to_sql('production', conn, if_exists='replace', index=False)
 
 conn.close()
 print("Excel data inserted into SQLite successfully.")
+
+# Retain the day's snapshot for multi-day comparisons and the drill-down rollup cube
+retain_snapshot(df, SNAPSHOT_DATE)
+print(f"Snapshot for {SNAPSHOT_DATE} retained in daily history and rolled up.")
+
+# Also retain it split by asset, so asset filtered queries only read their own partitions.
+# The daily history above stays the source of truth; the partitions are a copy
+# that can be rebuilt from it with python partitions.py
+write_partitions(df, SNAPSHOT_DATE)
+print(f"Snapshot for {SNAPSHOT_DATE} written to per-asset partitions.")
+
+# Flag production dips and shut-ins for the new day
+anomalies_df = detect_anomalies(SNAPSHOT_DATE)
+print(f"{len(anomalies_df)} anomalies flagged for {SNAPSHOT_DATE}.")
@@ -0,0 +1,286 @@
+import os
+import re
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+from history import (
+    HISTORY_DB,
+    UNASSIGNED,
+    available_dates,
+    closing_snapshots,
+    connect,
+    date_str,
+    read_query,
+    retain_snapshot,
+    well_deltas_query,
+    platform_deltas_query,
+    transitions_from_deltas,
+)
+
+# Partitioned history: one SQLite file per asset (optionally per asset and
+# month), each with the same tables as the single history database. A
+# catalog records which partitions exist and the dates they cover so a
+# query only opens the files it needs.
+#
+# The single history database stays the source of truth: it alone holds the
+# rollup cube and the anomalies, and the whole-field pages (drill-down,
+# anomalies, trends) read it directly since they would open every partition
+# anyway. The partitions are a derived copy for asset filtered comparisons
+# and can be rebuilt from it with rebuild_partitions().
+PARTITION_DIR = 'partitions'
+CATALOG_NAME = 'catalog.db'
+PARTITION_TABLES = ['production_history', 'well_daily', 'platform_daily']
+
+# SQLite's default limit on attached databases per connection; beyond it
+# partitions are copied into one in-memory database instead
+MAX_ATTACHED = 10
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+CATALOG_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS partitions (
+        "Asset" TEXT NOT NULL,
+        "Month" TEXT NOT NULL,
+        "File" TEXT NOT NULL,
+        "First Date" TEXT NOT NULL,
+        "Last Date" TEXT NOT NULL,
+        PRIMARY KEY ("Asset", "Month")
+    ) WITHOUT ROWID;
+"""
+
+
+def _connect_catalog(partition_dir):
+    conn = sqlite3.connect(os.path.join(partition_dir, CATALOG_NAME))
+    conn.executescript(CATALOG_SCHEMA)
+    return conn
+
+
+def partition_file(asset, month=''):
+    # e.g. petro-wellprod-bassein-sate.db, petro-wellprod-bassein-sate-202504.db
+    slug = re.sub(r'[^a-z0-9]+', '-', asset.lower()).strip('-')
+    suffix = f"-{month.replace('-', '')}" if month else ''
+    return f"petro-wellprod-{slug}{suffix}.db"
+
+
+def partitions_version(partition_dir=PARTITION_DIR):
+    # The catalog is rewritten on every ingest; used to key cached results
+    path = os.path.join(partition_dir, CATALOG_NAME)
+    return os.path.getmtime(path) if os.path.exists(path) else 0
+
+
+def write_partitions(snapshot_df, snapshot_date, by_month=False, partition_dir=PARTITION_DIR):
+    """Split one day's snapshot by asset (and month) and retain each part in its own file.
+
+    With by_month=True each monthly file carries in every well's last snapshot
+    (running totals included) from the asset's previous partition, so well
+    deltas and window sums can span months. Months must therefore be loaded
+    in order; after back-filling an earlier month, run rebuild_partitions().
+    """
+    snapshot_date = date_str(snapshot_date)
+    month = snapshot_date[:7] if by_month else ''
+    os.makedirs(partition_dir, exist_ok=True)
+
+    # Rows without a well are the sheet's platform subtotals and grand total;
+    # they carry no asset and would land in an UNASSIGNED partition of their own
+    snapshot_df = snapshot_df[snapshot_df["Well Id"].fillna(snapshot_df["Well String"]).notna()]
+    assets = snapshot_df["Asset"].fillna(UNASSIGNED)
+    catalog = _connect_catalog(partition_dir)
+    written = []
+    for asset, asset_df in snapshot_df.groupby(assets, sort=False):
+        file_name = partition_file(asset, month)
+        carry_in = None
+        if by_month:
+            previous = catalog.execute("""
+                SELECT "File" FROM partitions
+                WHERE "Asset" = ? AND "Month" <> '' AND "Month" < ?
+                ORDER BY "Month" DESC LIMIT 1
+            """, (asset, month)).fetchone()
+            if previous:
+                carry_in = closing_snapshots(os.path.join(partition_dir, previous[0]))
+        retain_snapshot(asset_df, snapshot_date, db_path=os.path.join(partition_dir, file_name), carry_in=carry_in)
+        written.append((asset, month, file_name, snapshot_date, snapshot_date))
+
+    # Re-loading a day must also clear it from assets no longer in the snapshot
+    stale = catalog.execute("""
+        SELECT "File" FROM partitions
+        WHERE "Month" = ? AND ? BETWEEN "First Date" AND "Last Date"
+    """, (month, snapshot_date)).fetchall()
+    written_files = {row[2] for row in written}
+    for (file_name,) in stale:
+        if file_name not in written_files:
+            retain_snapshot(snapshot_df.iloc[0:0], snapshot_date, db_path=os.path.join(partition_dir, file_name))
+
+    with catalog:
+        catalog.executemany("""
+            INSERT INTO partitions VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT ("Asset", "Month") DO UPDATE SET
+                "First Date" = MIN("First Date", excluded."First Date"),
+                "Last Date" = MAX("Last Date", excluded."Last Date")
+        """, written)
+    catalog.close()
+
+
+def select_partitions(assets=None, start_date=None, end_date=None, partition_dir=PARTITION_DIR):
+    """Catalog rows for the partitions overlapping the asset and date filters.
+
+    With a start date, each asset's last partition before it is kept as well,
+    so a query can still find the snapshot preceding the range.
+    """
+    if not os.path.exists(os.path.join(partition_dir, CATALOG_NAME)):
+        return pd.DataFrame(columns=["Asset", "Month", "File", "First Date", "Last Date"])
+
+    conditions, params = [], []
+    if assets:
+        conditions.append(f'"Asset" IN ({", ".join("?" * len(assets))})')
+        params.extend(assets)
+    if start_date is not None:
+        conditions.append("""("Last Date" >= ? OR "Last Date" = (
+            SELECT MAX(p."Last Date") FROM partitions p
+            WHERE p."Asset" = partitions."Asset" AND p."Last Date" < ?
+        ))""")
+        params.extend([date_str(start_date)] * 2)
+    if end_date is not None:
+        conditions.append('"First Date" <= ?')
+        params.append(date_str(end_date))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    catalog = _connect_catalog(partition_dir)
+    df = pd.read_sql_query(
+        f'SELECT * FROM partitions {where} ORDER BY "Asset", "Month"', catalog, params=params
+    )
+    catalog.close()
+    return df
+
+
+def available_assets(partition_dir=PARTITION_DIR):
+    return sorted(select_partitions(partition_dir=partition_dir)["Asset"].unique())
+
+
+def _read_tables(path, tables):
+    conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    frames = {table: pd.read_sql_query(f"SELECT * FROM {table}", conn) for table in tables}
+    conn.close()
+    return frames
+
+
+def _run_on_partitions(paths, query, params):
+    # paths are one asset's partitions in date order. A single partition is
+    # queried directly; up to MAX_ATTACHED are ATTACHed read-only and exposed
+    # through temp views with the usual table names. More than that are read
+    # in parallel and copied into one in-memory database (with the history
+    # indexes), reading only the tables the query uses. Either way the
+    # carry-in is the first partition's, i.e. from before the whole range.
+    if len(paths) == 1:
+        conn = sqlite3.connect(f"file:{paths[0]}?mode=ro", uri=True)
+    elif len(paths) <= MAX_ATTACHED:
+        conn = sqlite3.connect("file::memory:", uri=True)
+        for i, path in enumerate(paths):
+            conn.execute(f"ATTACH DATABASE ? AS p{i}", (f"file:{path}?mode=ro",))
+        for table in PARTITION_TABLES:
+            union = " UNION ALL ".join(f"SELECT * FROM p{i}.{table}" for i in range(len(paths)))
+            conn.execute(f"CREATE TEMP VIEW {table} AS {union}")
+        conn.execute("CREATE TEMP VIEW well_carry_in AS SELECT * FROM p0.well_carry_in")
+    else:
+        tables = [table for table in PARTITION_TABLES if table in query]
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as pool:
+            parts = list(pool.map(lambda path: _read_tables(path, tables), paths))
+        parts[0].update(_read_tables(paths[0], ['well_carry_in']))
+        conn = connect(":memory:")
+        for part in parts:
+            for table, df in part.items():
+                df.to_sql(table, conn, if_exists='append', index=False)
+    df = pd.read_sql_query(query, conn, params=params)
+    conn.close()
+    return df
+
+
+def federated_query(query, params=None, assets=None, start_date=None, end_date=None,
+                    partition_dir=PARTITION_DIR, max_workers=MAX_WORKERS):
+    """Run a history query over only the partitions matching the asset and date filters.
+
+    Each asset's partitions are queried together on one connection (so
+    per-well and per-platform windows see that asset's whole history in the
+    range) and assets run in parallel across a thread pool. Results are
+    concatenated; aggregates across assets are left to the caller. The date
+    filters only prune files, so the query should still filter on
+    "Production Date" itself.
+    """
+    selected = select_partitions(assets, start_date, end_date, partition_dir)
+    units = [
+        [os.path.join(partition_dir, name) for name in asset_partitions["File"]]
+        for _, asset_partitions in selected.groupby("Asset", sort=False)
+    ]
+
+    if not units:
+        return pd.DataFrame()
+    if len(units) == 1:
+        frames = [_run_on_partitions(units[0], query, params)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(units))) as pool:
+            frames = list(pool.map(lambda paths: _run_on_partitions(paths, query, params), units))
+    # Partitions with no matching rows would only muddle the result dtypes
+    return pd.concat([frame for frame in frames if not frame.empty] or frames[:1], ignore_index=True)
+
+
+def partition_dates(assets=None, partition_dir=PARTITION_DIR):
+    # No windows involved, so each file is read on its own and any number of
+    # partitions (e.g. years of monthly files) is fine
+    selected = select_partitions(assets, partition_dir=partition_dir)
+    paths = [[os.path.join(partition_dir, name)] for name in selected["File"]]
+    if not paths:
+        return []
+    query = 'SELECT DISTINCT "Production Date" FROM platform_daily'
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(paths))) as pool:
+        frames = list(pool.map(lambda unit: _run_on_partitions(unit, query, None), paths))
+    return sorted(set().union(*(frame["Production Date"] for frame in frames)))
+
+
+def federated_platform_deltas(start_date, end_date, window_days=7, assets=None, partition_dir=PARTITION_DIR):
+    query, params = platform_deltas_query(start_date, end_date, window_days)
+    lookback_start = pd.Timestamp(start_date) - pd.Timedelta(days=2 * window_days)
+    df = federated_query(query, params, assets, lookback_start, end_date, partition_dir)
+    if df.empty:
+        return df
+    return df.sort_values(["Production Date", "Delivery Network Group"], ignore_index=True)
+
+
+def federated_well_deltas(on_date, window_days=7, assets=None, partition_dir=PARTITION_DIR):
+    query, params = well_deltas_query(on_date, window_days)
+    lookback_start = pd.Timestamp(on_date) - pd.Timedelta(days=2 * window_days)
+    df = federated_query(query, params, assets, lookback_start, on_date, partition_dir)
+    if df.empty:
+        return df
+    return df.sort_values(["Delivery Network Group", "Well Id"], ignore_index=True)
+
+
+def federated_flow_transitions(on_date, assets=None, partition_dir=PARTITION_DIR):
+    deltas = federated_well_deltas(on_date, window_days=1, assets=assets, partition_dir=partition_dir)
+    if "Previously Flowing" not in deltas:
+        return deltas
+    return transitions_from_deltas(deltas)
+
+
+def rebuild_partitions(by_month=False, db_path=HISTORY_DB, partition_dir=PARTITION_DIR):
+    """Rewrite every partition from the single history database, day by day in order."""
+    if os.path.exists(os.path.join(partition_dir, CATALOG_NAME)):
+        for file_name in select_partitions(partition_dir=partition_dir)["File"]:
+            path = os.path.join(partition_dir, file_name)
+            if os.path.exists(path):
+                os.remove(path)
+        os.remove(os.path.join(partition_dir, CATALOG_NAME))
+
+    days = available_dates(db_path)
+    for day in days:
+        snapshot_df = read_query(
+            'SELECT * FROM production_history WHERE "Production Date" = ?', (day,), db_path=db_path
+        ).drop(columns="Production Date")
+        write_partitions(snapshot_df, day, by_month=by_month, partition_dir=partition_dir)
+    return days
+
+
+if __name__ == "__main__":
+    # Usage: python partitions.py [--by-month]
+    # Rebuilds the partitions from the single history database.
+    rebuilt = rebuild_partitions(by_month="--by-month" in sys.argv[1:])
+    print(f"Rebuilt partitions for {len(rebuilt)} snapshot dates.")
@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import date, datetime
+
+# Process-wide cache for page computations (melts, pivots, figures) shared by
+# every Streamlit session. Identical requests that arrive while the first one
+# is still computing wait for its result instead of computing it again.
+# Cached values are shared between sessions and must be treated as read-only.
+
+SHARED_CACHE_MAX_MB = int(os.environ.get("SHARED_CACHE_MAX_MB", "256"))
+
+
+def normalize_params(value):
+    """Hashable, order-stable form of page parameters (dict order ignored, list order kept)."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(key), normalize_params(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize_params(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(normalize_params(item) for item in value))
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return value
+
+
+def estimate_size(value):
+    """Approximate memory held by a cached value, in bytes."""
+    if hasattr(value, "memory_usage"):
+        # pandas DataFrame (per column usage) or Series
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, (str, bytes)):
+        return sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value.values())
+    try:
+        # Figures and other objects: their serialized size is a fair proxy
+        return len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class SharedCache:
+    """Bounded LRU cache with request coalescing, keyed by (page, params, data version)."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size, compute seconds)
+        self._in_flight = {}           # key -> Future
+        self._bytes = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "coalesced": 0,
+            "evictions": 0,
+            "errors": 0,
+            "compute_seconds": 0.0,
+            "saved_seconds": 0.0,
+        }
+
+    def get_or_compute(self, page, params, version, compute):
+        key = (page, normalize_params(params), normalize_params(version))
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                value, _, seconds = self._entries[key]
+                self._stats["hits"] += 1
+                self._stats["saved_seconds"] += seconds
+                return value
+
+            future = self._in_flight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                owner = False
+            else:
+                future = Future()
+                self._in_flight[key] = future
+                self._stats["misses"] += 1
+                owner = True
+
+        if not owner:
+            # Another session is computing the same thing; wait for it
+            value = future.result()
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._stats["saved_seconds"] += entry[2]
+            return value
+
+        start = time.perf_counter()
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[key]
+                self._stats["errors"] += 1
+            future.set_exception(e)
+            raise
+        seconds = time.perf_counter() - start
+
+        size = estimate_size(value)
+        with self._lock:
+            del self._in_flight[key]
+            self._stats["compute_seconds"] += seconds
+            if size <= self.max_bytes:
+                self._entries[key] = (value, size, seconds)
+                self._bytes += size
+                self._evict()
+        future.set_result(value)
+        return value
+
+    def _evict(self):
+        # Least recently used first; called with the lock held
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats["evictions"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+            stats["in_flight"] = len(self._in_flight)
+            stats["bytes"] = self._bytes
+            stats["max_bytes"] = self.max_bytes
+        requests = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["deduplicated"] = stats["hits"] + stats["coalesced"]
+        stats["dedup_ratio"] = stats["deduplicated"] / requests if requests else 0.0
+        return stats
+
+
+# Module level instance: Streamlit imports modules once per process, so every
+# session sees the same cache
+shared_cache = SharedCache(max_bytes=SHARED_CACHE_MAX_MB * 1024 * 1024)
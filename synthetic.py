@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+
+# Synthetic daily snapshots with the production sheet's columns, for the
+# benchmarks and tests. Well w belongs to ASSET-{w % 4}, AREA-{w % 8},
+# FIELD-{w % 12}, PLATFORM-{w % 40} and PN-{w % 200}.
+
+
+def synthetic_snapshot(num_wells, rng):
+    wells = np.arange(num_wells)
+    return pd.DataFrame({
+        "Process Platform/CTF": [f"PLATFORM-{w % 40:02d}" for w in wells],
+        "Platform No": [f"PN-{w % 200:03d}" for w in wells],
+        "Field": [f"FIELD-{w % 12:02d}" for w in wells],
+        "Well String": [f"WELL-{w:05d}-S" for w in wells],
+        "Well Id": [f"WELL-{w:05d}" for w in wells],
+        "Hrs Flown": rng.choice([0.0, 24.0], num_wells, p=[0.2, 0.8]),
+        "Allocated Oil ProductionMT": rng.uniform(0, 50, num_wells),
+        "Allocated Gas ProductionKCM": rng.uniform(0, 200, num_wells),
+        "Allocated Condensate ProductionMT": rng.uniform(0, 5, num_wells),
+        "Allocated Free Gas ProductionKCM": rng.uniform(0, 50, num_wells),
+        "Allocated Associated Gas ProductionKCM": rng.uniform(0, 150, num_wells),
+        "Allocated Water ProductionBB6": rng.uniform(0, 500, num_wells),
+        "Asset": [f"ASSET-{w % 4}" for w in wells],
+        "Area": [f"AREA-{w % 8}" for w in wells],
+    })
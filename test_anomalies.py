@@ -0,0 +1,130 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from anomalies import (
+    BASELINE_DAYS,
+    DIP_METRICS,
+    MAD_THRESHOLD,
+    MIN_BASELINE_DAYS,
+    MIN_SPREAD,
+    detect_anomalies,
+    find_anomalies,
+    load_anomalies,
+    rolling_baselines,
+)
+from history import retain_snapshot
+from synthetic import synthetic_snapshot
+
+# Rolling baselines and the anomalies flagged from them.
+# Run with: python -m pytest -q test_anomalies.py
+
+
+def well_history(well_id, values, flowing=None, start="2025-01-01"):
+    days = pd.date_range(start, periods=len(values)).strftime("%Y-%m-%d")
+    df = pd.DataFrame({
+        "Production Date": days,
+        "Well Id": well_id,
+        "Asset": "A1",
+        "Delivery Network Group": "P1",
+        "Flowing": 1 if flowing is None else flowing,
+    })
+    for metric in DIP_METRICS:
+        df[metric] = np.asarray(values, dtype=float)
+    return df
+
+
+def test_windows_stay_within_each_well():
+    # Interleaved by date, two wells at very different levels: neither
+    # baseline may pick up the other well's values
+    rng = np.random.default_rng(0)
+    high = well_history("W1", 1000 + rng.normal(0, 5, 60))
+    low = well_history("W2", 10 + rng.normal(0, 0.5, 60))
+    history = pd.concat([high, low]).sort_values(["Production Date", "Well Id"])
+
+    df = rolling_baselines(history)
+    baseline = df.groupby("Well Id")["Gas (KCM) Baseline"]
+    assert baseline.min()["W1"] > 900
+    assert baseline.max()["W2"] < 20
+
+    # The same as computing each well on its own
+    alone = rolling_baselines(low)
+    np.testing.assert_allclose(
+        df.loc[df["Well Id"] == "W2", "Gas (KCM) MAD"].to_numpy(),
+        alone["Gas (KCM) MAD"].to_numpy(),
+    )
+
+
+def test_baseline_needs_min_baseline_days():
+    df = rolling_baselines(well_history("W1", np.arange(1.0, BASELINE_DAYS + 10)))
+    baseline = df["Oil (MT) Baseline"]
+
+    # Row i has i previous snapshots; the current day is never in its own window
+    assert baseline[:MIN_BASELINE_DAYS].isna().all()
+    assert baseline[MIN_BASELINE_DAYS] == np.median(np.arange(1.0, MIN_BASELINE_DAYS + 1))
+    # Later windows hold exactly BASELINE_DAYS snapshots
+    last = len(df) - 1
+    assert baseline[last] == np.median(np.arange(last - BASELINE_DAYS + 1.0, last + 1))
+
+
+def test_dip_on_flat_history_uses_spread_floor():
+    # A perfectly flat history has MAD 0; the spread is floored at
+    # MIN_SPREAD of the baseline, so halving scores -0.5 / MIN_SPREAD
+    df = rolling_baselines(well_history("W1", [100.0] * 20 + [50.0]))
+    assert df["Gas (KCM) MAD"].iloc[-1] == 0
+
+    anomalies = find_anomalies(df)
+    dips = anomalies[anomalies["Anomaly Type"] == "Production Dip"]
+    assert sorted(dips["Metric"]) == sorted(DIP_METRICS)
+    assert (dips["Production Date"] == df["Production Date"].iloc[-1]).all()
+    assert dips["Score"].to_numpy() == pytest.approx(-0.5 / MIN_SPREAD)
+    assert (dips["Score"] <= -MAD_THRESHOLD).all()
+
+    # A small wobble on the flat history is not a dip
+    wobble = rolling_baselines(well_history("W1", [100.0] * 20 + [97.0]))
+    assert find_anomalies(wobble).empty
+
+
+def test_shut_in_is_flagged_once():
+    flowing = [1] * 10 + [0] * 3
+    values = [100.0] * 10 + [0.0] * 3
+    anomalies = find_anomalies(rolling_baselines(well_history("W1", values, flowing)))
+
+    # Only the first non-flowing day, and not also as a dip
+    assert list(anomalies["Anomaly Type"]) == ["Shut-in"]
+    assert anomalies["Production Date"].iloc[0] == "2025-01-11"
+    assert anomalies["Metric"].iloc[0] == "Flowing"
+    assert pd.isna(anomalies["Score"].iloc[0])
+
+
+def test_detect_anomalies_rewrites_its_date_range(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    rng = np.random.default_rng(0)
+    days = pd.date_range("2025-03-01", periods=12).strftime("%Y-%m-%d")
+    for day in days:
+        retain_snapshot(synthetic_snapshot(50, rng), day, db_path=db_path)
+
+    detect_anomalies(days[0], days[-1], db_path=db_path)
+    expected = load_anomalies(days[-3], days[-1], db_path=db_path)
+
+    # Stale rows: one inside the range being recomputed, one outside it
+    conn = sqlite3.connect(db_path)
+    with conn:
+        for day in [days[-2], days[0]]:
+            conn.execute(
+                "INSERT INTO well_anomalies VALUES (?, 'STALE', 'Production Dip', 'Gas (KCM)', NULL, NULL, 0, 1, -1, -9)",
+                (day,),
+            )
+    conn.close()
+
+    found = detect_anomalies(days[-3], days[-1], db_path=db_path)
+    stored = load_anomalies(days[-3], days[-1], db_path=db_path)
+    assert len(stored) == len(found)
+    assert "STALE" not in stored["Well Id"].tolist()
+    pd.testing.assert_frame_equal(stored, expected)
+
+    # Dates outside the range are left alone
+    outside = load_anomalies(days[0], days[0], db_path=db_path)
+    assert "STALE" in outside["Well Id"].tolist()
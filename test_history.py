@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from history import VOLUME_COLUMNS, platform_deltas, retain_snapshot, well_deltas
+from synthetic import synthetic_snapshot
+
+# Well and platform comparisons must agree on what "previous snapshot" and
+# "window change" mean. Run with: python -m pytest -q test_history.py
+
+
+def retain(db_path, days, num_wells=120, seed=0):
+    rng = np.random.default_rng(seed)
+    for day in days:
+        retain_snapshot(synthetic_snapshot(num_wells, rng), day, db_path=db_path)
+
+
+def platform_totals(wells, column):
+    # Well level deltas summed per platform; NaN stays NaN (min_count)
+    return wells.groupby("Delivery Network Group")[column].sum(min_count=1)
+
+
+def test_window_change_is_null_without_prior_snapshot(tmp_path):
+    db_path = str(tmp_path / "history.db")
+    retain(db_path, ["2025-04-01", "2025-04-06"])
+
+    platforms = platform_deltas("2025-04-06", "2025-04-06", 1, db_path=db_path)
+    wells = well_deltas("2025-04-06", 1, db_path=db_path)
+    for column in VOLUME_COLUMNS:
+        assert platforms[f"{column} Window Change"].isna().all()
+        assert wells[f"{column} Window Change"].isna().all()
+        assert wells[f"{column} Window Sum"].notna().all()
+    assert wells["Flowing Days Window Change"].isna().all()
+
+
+@pytest.mark.parametrize("window_days", [1, 2, 7])
+def test_well_deltas_add_up_to_platform_deltas(tmp_path, window_days):
+    db_path = str(tmp_path / "history.db")
+    # Gaps of several days, so some windows are empty
+    days = ["2025-03-20", "2025-03-21", "2025-03-25", "2025-03-30", "2025-04-03", "2025-04-06"]
+    retain(db_path, days)
+
+    platforms = platform_deltas("2025-04-06", "2025-04-06", window_days, db_path=db_path)
+    platforms = platforms.set_index("Delivery Network Group")
+    wells = well_deltas("2025-04-06", window_days, db_path=db_path)
+
+    for column in VOLUME_COLUMNS:
+        for suffix in ["DoD Change", "Window Sum", "Window Change"]:
+            pd.testing.assert_series_equal(
+                platform_totals(wells, f"{column} {suffix}"),
+                platforms[f"{column} {suffix}"],
+                check_names=False,
+            )
+
+
+def test_previous_snapshot_beyond_lookback(tmp_path):
+    # A 3-day gap with a 1-day window: the lookback doesn't reach the previous
+    # snapshot, but both tables must still compare against it
+    db_path = str(tmp_path / "history.db")
+    retain(db_path, ["2025-04-01", "2025-04-02", "2025-04-06"])
+
+    platforms = platform_deltas("2025-04-06", "2025-04-06", 1, db_path=db_path)
+    wells = well_deltas("2025-04-06", 1, db_path=db_path)
+
+    assert (platforms["Previous Date"] == "2025-04-02").all()
+    assert (wells["Previous Date"] == "2025-04-02").all()
+    pd.testing.assert_series_equal(
+        platform_totals(wells, "Gas (KCM) DoD Change"),
+        platforms.set_index("Delivery Network Group")["Gas (KCM) DoD Change"],
+        check_names=False,
+    )
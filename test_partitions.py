@@ -0,0 +1,170 @@
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from synthetic import synthetic_snapshot
+from history import (
+    UNASSIGNED,
+    date_str,
+    flow_transitions,
+    platform_deltas,
+    read_query,
+    retain_snapshot,
+    well_deltas,
+)
+from partitions import (
+    MAX_ATTACHED,
+    available_assets,
+    federated_flow_transitions,
+    federated_platform_deltas,
+    federated_well_deltas,
+    partition_dates,
+    rebuild_partitions,
+    write_partitions,
+)
+
+# Federated (per-asset partition) results must match the single history
+# database. Run with: python -m pytest -q test_partitions.py
+
+WELLPROD_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'petro-wellprod-06042025.db')
+
+
+def assert_same(federated, single, keys):
+    pd.testing.assert_frame_equal(
+        federated.sort_values(keys, ignore_index=True),
+        single.sort_values(keys, ignore_index=True),
+        check_dtype=False,
+    )
+
+
+@pytest.fixture
+def shipped_history(tmp_path):
+    # The shipped snapshot retained for two days (with a gap), the second with
+    # some wells shut in, in both the single database and per-asset partitions
+    if not os.path.exists(WELLPROD_DB):
+        pytest.skip("shipped production database not available")
+    conn = sqlite3.connect(WELLPROD_DB)
+    snapshot = pd.read_sql_query('SELECT * FROM production', conn)
+    conn.close()
+
+    rng = np.random.default_rng(0)
+    second = snapshot.copy()
+    second["Allocated Gas ProductionKCM"] *= rng.uniform(0.8, 1.2, len(second))
+    shut = (second["Hrs Flown"] > 0) & (rng.random(len(second)) < 0.1)
+    second.loc[shut, "Hrs Flown"] = 0
+
+    db_path = str(tmp_path / "history.db")
+    partition_dir = str(tmp_path / "partitions")
+    for day, df in [("2025-04-03", snapshot), ("2025-04-06", second)]:
+        retain_snapshot(df, day, db_path=db_path)
+        write_partitions(df, day, partition_dir=partition_dir)
+    return snapshot, db_path, partition_dir
+
+
+def test_subtotal_rows_are_not_partitioned(shipped_history):
+    snapshot, db_path, partition_dir = shipped_history
+    wells = snapshot[snapshot["Well Id"].fillna(snapshot["Well String"]).notna()]
+
+    assert available_assets(partition_dir) == sorted(wells["Asset"].dropna().unique())
+    assert UNASSIGNED not in available_assets(partition_dir)
+
+    federated = federated_platform_deltas("2025-04-06", "2025-04-06", 1, partition_dir=partition_dir)
+    assert federated["Delivery Network Group"].is_unique
+    assert federated["Gas (KCM)"].sum() == pytest.approx(
+        platform_deltas("2025-04-06", "2025-04-06", 1, db_path=db_path)["Gas (KCM)"].sum()
+    )
+
+
+@pytest.mark.parametrize("window_days", [1, 7])
+def test_federated_matches_single_db(shipped_history, window_days):
+    _, db_path, partition_dir = shipped_history
+
+    assert partition_dates(partition_dir=partition_dir) == ["2025-04-03", "2025-04-06"]
+    assert_same(
+        federated_platform_deltas("2025-04-06", "2025-04-06", window_days, partition_dir=partition_dir),
+        platform_deltas("2025-04-06", "2025-04-06", window_days, db_path=db_path),
+        ["Production Date", "Delivery Network Group"],
+    )
+    assert_same(
+        federated_well_deltas("2025-04-06", window_days, partition_dir=partition_dir),
+        well_deltas("2025-04-06", window_days, db_path=db_path),
+        ["Well Id"],
+    )
+    transitions = flow_transitions("2025-04-06", db_path=db_path)
+    assert len(transitions) > 0
+    assert_same(federated_flow_transitions("2025-04-06", partition_dir=partition_dir), transitions, ["Well Id"])
+
+
+@pytest.fixture
+def monthly_history(tmp_path):
+    # One snapshot per month for more than MAX_ATTACHED months: the previous
+    # snapshot is always outside the lookback, in the previous month's file.
+    # Some wells miss whole months, the month before the last included.
+    rng = np.random.default_rng(1)
+    db_path = str(tmp_path / "history.db")
+    days = pd.date_range("2024-01-15", periods=MAX_ATTACHED + 2, freq="MS") + pd.Timedelta(days=14)
+    for i, day in enumerate(days):
+        num_wells = 72 if i % 4 == 1 or i == len(days) - 2 else 80
+        retain_snapshot(synthetic_snapshot(num_wells, rng), day, db_path=db_path)
+    return [date_str(day) for day in days], db_path
+
+
+def assert_monthly_matches(days, db_path, partition_dir):
+    assert partition_dates(partition_dir=partition_dir) == days
+
+    single = platform_deltas(days[-2], days[-1], 7, db_path=db_path)
+    assert single["Gas (KCM) DoD Change"].notna().all()
+    assert_same(
+        federated_platform_deltas(days[-2], days[-1], 7, partition_dir=partition_dir),
+        single, ["Production Date", "Delivery Network Group"],
+    )
+    # The whole range: each asset needs more partitions than can be attached
+    assert_same(
+        federated_platform_deltas(days[0], days[-1], 7, partition_dir=partition_dir),
+        platform_deltas(days[0], days[-1], 7, db_path=db_path),
+        ["Production Date", "Delivery Network Group"],
+    )
+
+    # Well window sums and changes span months through the carried-in totals;
+    # a 200 day window reads every partition
+    for window_days in [7, 45, 200]:
+        single = well_deltas(days[-1], window_days, db_path=db_path)
+        assert single["Previous Date"].notna().all()
+        assert_same(
+            federated_well_deltas(days[-1], window_days, partition_dir=partition_dir),
+            single, ["Well Id"],
+        )
+    assert_same(
+        federated_flow_transitions(days[-1], partition_dir=partition_dir),
+        flow_transitions(days[-1], db_path=db_path),
+        ["Well Id"],
+    )
+
+
+def test_monthly_partitions(monthly_history, tmp_path):
+    days, db_path = monthly_history
+    partition_dir = str(tmp_path / "partitions")
+    rebuild_partitions(by_month=True, db_path=db_path, partition_dir=partition_dir)
+
+    assert_monthly_matches(days, db_path, partition_dir)
+
+
+def test_rebuild_after_out_of_order_months(monthly_history, tmp_path):
+    # Loading the months newest first leaves every carry-in empty; rebuilding
+    # from the single history database fixes that
+    days, db_path = monthly_history
+    partition_dir = str(tmp_path / "partitions")
+    for day in reversed(days):
+        snapshot = read_query(
+            'SELECT * FROM production_history WHERE "Production Date" = ?', (day,), db_path=db_path
+        ).drop(columns="Production Date")
+        write_partitions(snapshot, day, by_month=True, partition_dir=partition_dir)
+    federated = federated_well_deltas(days[-1], 200, partition_dir=partition_dir).set_index("Well Id")
+    single = well_deltas(days[-1], 200, db_path=db_path).set_index("Well Id")
+    assert (federated["Gas (KCM) Window Sum"] < single["Gas (KCM) Window Sum"]).any()
+
+    assert rebuild_partitions(by_month=True, db_path=db_path, partition_dir=partition_dir) == days
+    assert_monthly_matches(days, db_path, partition_dir)
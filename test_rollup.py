@@ -0,0 +1,106 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from history import (
+    ROLLUP_LEVELS,
+    UNASSIGNED,
+    VOLUME_COLUMNS,
+    rebuild_rollup,
+    retain_snapshot,
+    rollup_children,
+    rollup_history,
+    rollup_node,
+)
+from synthetic import synthetic_snapshot
+
+# Every level of the rollup cube must add up, from the wells to the grand
+# total, and agree with platform_daily. Run with: python -m pytest -q test_rollup.py
+
+DAYS = ["2025-04-05", "2025-04-06"]
+TOTALS = [*VOLUME_COLUMNS, "Flowing Wells", "Non-Flowing Wells", "Total Wells"]
+
+
+def read_table(db_path, table):
+    conn = sqlite3.connect(db_path)
+    df = pd.read_sql_query(f"SELECT * FROM {table}", conn)
+    conn.close()
+    return df
+
+
+@pytest.fixture
+def history_db(tmp_path):
+    # Synthetic wells, some with a missing or blank level, plus a platform
+    # subtotal row (no well) as in the production sheet
+    rng = np.random.default_rng(0)
+    db_path = str(tmp_path / "history.db")
+    for day in DAYS:
+        snapshot = synthetic_snapshot(200, rng)
+        snapshot.loc[0:4, "Asset"] = None
+        snapshot.loc[5:9, "Asset"] = ""
+        snapshot.loc[10:14, "Area"] = ""
+        snapshot.loc[15:19, "Platform No"] = None
+        subtotal = snapshot.iloc[[20]].assign(**{"Well Id": None, "Well String": None})
+        retain_snapshot(pd.concat([snapshot, subtotal], ignore_index=True), day, db_path=db_path)
+    return db_path
+
+
+def test_each_level_is_the_sum_of_its_children(history_db):
+    cube = read_table(history_db, "rollup_daily")
+    for level in range(len(ROLLUP_LEVELS)):
+        parents = cube[cube["Level"] == level].set_index(["Production Date", *ROLLUP_LEVELS[:level]])[TOTALS]
+        children = cube[cube["Level"] == level + 1]
+        summed = children.groupby(["Production Date", *ROLLUP_LEVELS[:level]])[TOTALS].sum()
+        pd.testing.assert_frame_equal(parents.sort_index(), summed.sort_index(), check_dtype=False)
+
+    # Wells are counted once each, and subtotal rows not at all
+    wells = cube[cube["Level"] == len(ROLLUP_LEVELS)]
+    assert wells.groupby("Production Date")["Total Wells"].sum().tolist() == [200, 200]
+
+
+def test_platform_level_matches_platform_daily(history_db):
+    cube = read_table(history_db, "rollup_daily")
+    platforms = cube[cube["Level"] == ROLLUP_LEVELS.index("Delivery Network Group") + 1]
+    from_cube = platforms.groupby(["Production Date", "Delivery Network Group"])[TOTALS].sum()
+
+    platform_daily = read_table(history_db, "platform_daily")
+    pd.testing.assert_frame_equal(
+        from_cube.sort_index(),
+        platform_daily.set_index(["Production Date", "Delivery Network Group"])[TOTALS].sort_index(),
+        check_dtype=False,
+    )
+
+    total = rollup_node(DAYS[-1], (), db_path=history_db).iloc[0]
+    on_day = platform_daily[platform_daily["Production Date"] == DAYS[-1]]
+    for column in TOTALS:
+        assert total[column] == pytest.approx(on_day[column].sum())
+
+
+def test_missing_and_blank_levels_are_unassigned(history_db):
+    cube = read_table(history_db, "rollup_daily")
+    for level, column in enumerate(ROLLUP_LEVELS, start=1):
+        # Only columns below a row's level are ''
+        assert (cube.loc[cube["Level"] >= level, column] != "").all()
+
+    assets = rollup_children(DAYS[-1], (), db_path=history_db)
+    assert assets["Asset"].tolist().count(UNASSIGNED) == 1
+    assert assets.set_index("Asset").loc[UNASSIGNED, "Total Wells"] == 10
+
+    # An unassigned level can be drilled into like any other
+    areas = rollup_children(DAYS[-1], ("ASSET-2",), db_path=history_db)
+    assert UNASSIGNED in areas["Area"].tolist()
+    node = rollup_node(DAYS[-1], (UNASSIGNED,), db_path=history_db)
+    assert node["Total Wells"].tolist() == [10]
+
+
+def test_history_has_one_row_per_day(history_db):
+    for path in [(), ("ASSET-1",), ("ASSET-1", "AREA-1")]:
+        history = rollup_history(path, db_path=history_db)
+        assert history["Production Date"].tolist() == DAYS
+
+    # Rebuilding from the retained days gives the same cube
+    before = read_table(history_db, "rollup_daily")
+    rebuild_rollup(db_path=history_db)
+    pd.testing.assert_frame_equal(read_table(history_db, "rollup_daily"), before)
@@ -0,0 +1,144 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from shared_cache import SharedCache, estimate_size, normalize_params
+
+# Coalescing, eviction and key normalization of the cross-session cache.
+# Run with: python -m pytest -q test_shared_cache.py
+
+WAITERS = 8
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out waiting for requests to coalesce"
+        time.sleep(0.005)
+
+
+def concurrent_requests(cache, compute):
+    # WAITERS identical requests, all in flight before compute may finish
+    release = threading.Event()
+
+    def blocked_compute():
+        release.wait(5)
+        return compute()
+
+    def request():
+        try:
+            return cache.get_or_compute("page", {"on_date": "2025-04-06"}, 1, blocked_compute)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=WAITERS) as pool:
+        futures = [pool.submit(request) for _ in range(WAITERS)]
+        wait_for(lambda: cache.stats()["coalesced"] == WAITERS - 1)
+        release.set()
+        return [future.result() for future in futures]
+
+
+def test_concurrent_requests_compute_once():
+    cache = SharedCache(max_bytes=1024 * 1024)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return b"x" * 100
+
+    results = concurrent_requests(cache, compute)
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"], stats["in_flight"]) == (1, WAITERS - 1, 0)
+
+    # Later requests are plain hits
+    assert cache.get_or_compute("page", {"on_date": "2025-04-06"}, 1, compute) is results[0]
+    assert len(calls) == 1 and cache.stats()["hits"] == 1
+
+
+def test_error_reaches_every_waiter():
+    cache = SharedCache(max_bytes=1024 * 1024)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        raise RuntimeError("query failed")
+
+    results = concurrent_requests(cache, compute)
+
+    assert len(calls) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    stats = cache.stats()
+    assert (stats["errors"], stats["entries"], stats["in_flight"]) == (1, 0, 0)
+    assert not cache._in_flight
+
+    # Errors are not cached: the next request computes again
+    assert cache.get_or_compute("page", {"on_date": "2025-04-06"}, 1, lambda: "ok") == "ok"
+
+
+def test_lru_eviction_under_max_bytes():
+    value_size = estimate_size(b"x" * 1000)
+    cache = SharedCache(max_bytes=2 * value_size)
+
+    def get(name):
+        return cache.get_or_compute("page", name, 1, lambda: b"x" * 1000)
+
+    get("a")
+    get("b")
+    get("a")  # a is now more recently used than b
+    get("c")
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["bytes"]) == (2, 1, 2 * value_size)
+    assert set(key[1] for key in cache._entries) == {"a", "c"}
+
+    hits = stats["hits"]
+    get("a")
+    assert cache.stats()["hits"] == hits + 1
+    get("b")
+    assert cache.stats()["misses"] == 4
+
+
+def test_oversize_values_are_not_stored():
+    cache = SharedCache(max_bytes=500)
+    cache.get_or_compute("page", "small", 1, lambda: b"x" * 100)
+
+    big = cache.get_or_compute("page", "big", 1, lambda: b"x" * 1000)
+
+    assert len(big) == 1000
+    stats = cache.stats()
+    # Nothing was evicted to make room for a value that could never fit
+    assert (stats["entries"], stats["evictions"]) == (1, 0)
+    assert stats["bytes"] == estimate_size(b"x" * 100)
+
+
+@pytest.mark.parametrize("left, right", [
+    ({"a": 1, "b": [1, 2]}, {"b": [1, 2], "a": 1}),
+    ({"window": np.int64(3)}, {"window": 3}),
+    ({"ratio": np.float64(0.5)}, {"ratio": 0.5}),
+    (date(2025, 4, 6), "2025-04-06"),
+    (datetime(2025, 4, 6, 12), "2025-04-06T12:00:00"),
+    ({"assets": {"B", "A"}}, {"assets": {"A", "B"}}),
+])
+def test_equivalent_params_share_a_key(left, right):
+    assert normalize_params(left) == normalize_params(right)
+    hash(normalize_params(left))
+
+    cache = SharedCache(max_bytes=1024)
+    cache.get_or_compute("page", left, 1, lambda: "value")
+    assert cache.get_or_compute("page", right, 1, lambda: "other") == "value"
+
+
+def test_list_order_and_version_are_part_of_the_key():
+    assert normalize_params(["A", "B"]) != normalize_params(["B", "A"])
+
+    cache = SharedCache(max_bytes=1024)
+    cache.get_or_compute("page", ["A", "B"], 1, lambda: "first")
+    assert cache.get_or_compute("page", ["B", "A"], 1, lambda: "second") == "second"
+    assert cache.get_or_compute("page", ["A", "B"], 2, lambda: "newer") == "newer"
@@ -0,0 +1,21 @@
+import importlib
+
+# Page title -> view module. Each module exposes render() and is only imported
+# the first time its page is selected, so plotly and page-specific work stay
+# off the startup path of pages that don't need them.
+PAGES = {
+    "Standard Volume by Delivery Network": "views.network_volume",
+    "Standard Volume over Time": "views.volume_over_time",
+    "Tiled Charts": "views.tiled_charts",
+    "Well Status Analysis": "views.well_status",
+    "Well Status Map": "views.well_map",
+    "Well Production Trends": "views.well_trends",
+    "Measurement Point Radar": "views.radar",
+    "Multi-Day Comparison": "views.comparison",
+    "Hierarchy Drill-Down": "views.drilldown",
+}
+
+
+def load_view(page):
+    # importlib caches modules in sys.modules, so later reruns are a dict lookup
+    return importlib.import_module(PAGES[page])
@@ -0,0 +1,158 @@
+import streamlit as st
+import plotly.express as px
+
+from history import (
+    VOLUME_COLUMNS,
+    available_dates,
+    flow_transitions,
+    history_version,
+    platform_deltas,
+    well_deltas,
+)
+from partitions import (
+    available_assets,
+    federated_flow_transitions,
+    federated_platform_deltas,
+    federated_well_deltas,
+    partition_dates,
+    partitions_version,
+)
+
+# Cached per data version so a new ingest invalidates earlier results.
+# assets is None for the single history database, otherwise a tuple of
+# assets whose partitions are federated. Every date, window and asset
+# selection is a new entry, so keep at most CACHE_MAX_ENTRIES per loader.
+CACHE_MAX_ENTRIES = 64
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_dates(assets, version):
+    return available_dates() if assets is None else partition_dates(list(assets))
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_platform_deltas(on_date, window_days, assets, version):
+    if assets is None:
+        return platform_deltas(on_date, on_date, window_days)
+    return federated_platform_deltas(on_date, on_date, window_days, assets=list(assets))
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_well_deltas(on_date, window_days, assets, version):
+    if assets is None:
+        return well_deltas(on_date, window_days)
+    return federated_well_deltas(on_date, window_days, assets=list(assets))
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_flow_transitions(on_date, assets, version):
+    if assets is None:
+        return flow_transitions(on_date)
+    return federated_flow_transitions(on_date, assets=list(assets))
+
+
+def render():
+    st.header("Multi-Day Comparison")
+
+    # Use the per-asset partitions when they exist, so only the selected assets are read
+    st.sidebar.title("Comparison")
+    partitioned_assets = available_assets()
+    if partitioned_assets:
+        selected_assets = st.sidebar.multiselect(
+            "Assets",
+            partitioned_assets,
+            default=partitioned_assets
+        )
+        if not selected_assets:
+            st.warning("Please select at least one asset.")
+            return
+        assets = tuple(selected_assets)
+        version = partitions_version()
+    else:
+        assets = None
+        version = history_version()
+
+    dates = load_dates(assets, version)
+    if not dates:
+        st.warning("No daily history has been retained yet. Run insert.py to ingest a snapshot.")
+        return
+
+    on_date = st.sidebar.selectbox(
+        "Comparison Date",
+        dates[::-1],
+        help="Snapshot to compare against the previous day and the preceding window"
+    )
+    window_days = st.sidebar.slider(
+        "Rolling Window (days)",
+        min_value=1,
+        max_value=90,
+        value=7,
+        help="Window length for rolling sums; compared with the window before it"
+    )
+
+    volume_type = st.selectbox(
+        "Select Volume Type",
+        list(VOLUME_COLUMNS),
+        index=1
+    )
+
+    # Wells that changed flowing state since their previous snapshot
+    st.subheader("Flowing Status Changes")
+    transitions_df = load_flow_transitions(on_date, assets, version)
+    stopped = transitions_df[transitions_df["Transition"] == "Stopped Flowing"]
+    started = transitions_df[transitions_df["Transition"] == "Started Flowing"]
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Wells Stopped Flowing", f"{len(stopped):,}")
+    with col2:
+        st.metric("Wells Started Flowing", f"{len(started):,}")
+
+    if transitions_df.empty:
+        st.info("No wells changed flowing status since the previous snapshot.")
+    else:
+        st.dataframe(transitions_df[[
+            "Well Id", "Delivery Network Group", "Transition", "Previous Date",
+            volume_type, f"{volume_type} DoD Change"
+        ]])
+
+    # Platform level day-over-day and window changes
+    platform_df = load_platform_deltas(on_date, window_days, assets, version)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_dod = px.bar(
+            platform_df.sort_values(f"{volume_type} DoD Change"),
+            x='Delivery Network Group',
+            y=f"{volume_type} DoD Change",
+            title=f'{volume_type} Change since Previous Snapshot',
+            labels={'Delivery Network Group': 'Delivery Network'},
+            height=450
+        )
+        fig_dod.update_layout(xaxis_tickangle=45)
+        st.plotly_chart(fig_dod, use_container_width=True)
+
+    with col2:
+        fig_window = px.bar(
+            platform_df.sort_values(f"{volume_type} Window Change"),
+            x='Delivery Network Group',
+            y=f"{volume_type} Window Change",
+            title=f'{window_days}-Day {volume_type} Change vs Previous {window_days} Days',
+            labels={'Delivery Network Group': 'Delivery Network'},
+            height=450
+        )
+        fig_window.update_layout(xaxis_tickangle=45)
+        st.plotly_chart(fig_window, use_container_width=True)
+
+    st.subheader("Platform Deltas")
+    st.dataframe(platform_df[[
+        "Delivery Network Group", volume_type, f"{volume_type} DoD Change",
+        f"{volume_type} Window Sum", f"{volume_type} Window Change",
+        "Flowing Wells", "Flowing Wells DoD Change"
+    ]])
+
+    # Largest well level drops over the window
+    st.subheader(f"Well Deltas ({window_days}-Day Window)")
+    wells_df = load_well_deltas(on_date, window_days, assets, version)
+    st.dataframe(wells_df.sort_values(f"{volume_type} Window Change")[[
+        "Well Id", "Delivery Network Group", "Flowing", "Previously Flowing",
+        volume_type, f"{volume_type} DoD Change",
+        f"{volume_type} Window Sum", f"{volume_type} Window Change",
+        "Flowing Days Window Sum"
+    ]])
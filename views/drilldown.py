@@ -0,0 +1,139 @@
+import streamlit as st
+import plotly.express as px
+
+from history import (
+    ROLLUP_LEVELS,
+    VOLUME_COLUMNS,
+    available_dates,
+    history_version,
+    rollup_children,
+    rollup_history,
+    rollup_node,
+)
+
+# Every level comes from the rollup cube built at ingest, so moving up or
+# down is a keyed lookup. Cached per history version like the comparison page;
+# each date and path visited is a new entry, so keep at most CACHE_MAX_ENTRIES.
+CACHE_MAX_ENTRIES = 256
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_dates(version):
+    return available_dates()
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_node(on_date, path, version):
+    return rollup_node(on_date, path)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_children(on_date, path, version):
+    return rollup_children(on_date, path)
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES)
+def load_node_history(path, version):
+    return rollup_history(path)
+
+
+def set_path(path):
+    st.session_state["drilldown_path"] = list(path)
+
+
+def render():
+    st.header("Hierarchy Drill-Down")
+
+    version = history_version()
+    dates = load_dates(version)
+    if not dates:
+        st.warning("No daily history has been retained yet. Run insert.py to ingest a snapshot.")
+        return
+
+    st.sidebar.title("Drill-Down")
+    on_date = st.sidebar.selectbox("Production Date", dates[::-1])
+    volume_type = st.selectbox(
+        "Select Volume Type",
+        list(VOLUME_COLUMNS),
+        index=1
+    )
+
+    # Breadcrumb: one button per level of the current path, clicking one goes back up to it
+    path = tuple(st.session_state.setdefault("drilldown_path", []))
+    crumbs = ["All Assets", *path]
+    cols = st.columns(len(crumbs))
+    for depth, (col, label) in enumerate(zip(cols, crumbs)):
+        with col:
+            st.button(
+                label,
+                key=f"drilldown_crumb_{depth}",
+                on_click=set_path,
+                args=(path[:depth],),
+                disabled=depth == len(path)
+            )
+
+    node_df = load_node(on_date, path, version)
+    if node_df.empty:
+        st.info(f"{' / '.join(path)} has no production on {on_date}.")
+        return
+    node = node_df.iloc[0]
+    level_name = ROLLUP_LEVELS[len(path) - 1] if path else "Total"
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric(f"{level_name}: {volume_type}", f"{node[volume_type]:,.2f}")
+    with col2:
+        st.metric("Flowing Wells", f"{node['Flowing Wells']:,}")
+    with col3:
+        st.metric("Non-Flowing Wells", f"{node['Non-Flowing Wells']:,}")
+    with col4:
+        st.metric("Total Wells", f"{node['Total Wells']:,}")
+
+    children_df = load_children(on_date, path, version)
+    if not children_df.empty:
+        child_level = ROLLUP_LEVELS[len(path)]
+        children_df = children_df.sort_values(volume_type, ascending=False)
+
+        col1, col2 = st.columns([2, 1])
+        with col1:
+            fig = px.bar(
+                children_df,
+                x=child_level,
+                y=volume_type,
+                title=f'{volume_type} by {child_level}',
+                height=450
+            )
+            fig.update_layout(xaxis_tickangle=45)
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            fig_wells = px.bar(
+                children_df,
+                x=child_level,
+                y=['Flowing Wells', 'Non-Flowing Wells'],
+                title=f'Well Status by {child_level}',
+                height=450,
+                barmode='stack'
+            )
+            fig_wells.update_layout(xaxis_tickangle=45, yaxis_title='Count', legend_title='Well Status')
+            st.plotly_chart(fig_wells, use_container_width=True)
+
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            child = st.selectbox(f"Drill into {child_level}", children_df[child_level].tolist())
+        with col2:
+            st.button("Drill Down", on_click=set_path, args=((*path, child),))
+
+        st.subheader(f"{child_level} Summary")
+        st.dataframe(children_df[[
+            child_level, *VOLUME_COLUMNS, "Flowing Wells", "Non-Flowing Wells", "Total Wells"
+        ]])
+
+    # The same node on every retained day
+    history_df = load_node_history(path, version)
+    if len(history_df) > 1:
+        fig_history = px.line(
+            history_df,
+            x="Production Date",
+            y=volume_type,
+            markers=True,
+            title=f"{volume_type} per Day: {' / '.join(path) or 'All Assets'}",
+            height=400
+        )
+        st.plotly_chart(fig_history, use_container_width=True)
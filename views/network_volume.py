@@ -0,0 +1,127 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from data import load_delivery_network_data, data_version
+from shared_cache import shared_cache
+
+PAGE = "Standard Volume by Delivery Network"
+
+
+# Figures are built once per volume type and data version and shared across
+# sessions; see shared_cache.py
+def build_all_volumes_figures(delivery_network_df):
+    # Create a melted dataframe for all volume types
+    melted_df = pd.melt(
+        delivery_network_df,
+        id_vars=['Delivery Network Group'],
+        value_vars=['Gas (KCM)', 'Oil (MT)', 'Condensate (MT)', 'Water (BB6)'],
+        var_name='Volume Type',
+        value_name='Volume'
+    )
+
+    # Separate chart for water if "All Volumes" is selected (due to scale difference)
+    fig1 = px.bar(
+        melted_df[melted_df['Volume Type'] != 'Water (BB6)'],
+        x='Delivery Network Group',
+        y='Volume',
+        color='Volume Type',
+        title='Standard Volume by Delivery Network Group (Excluding Water)',
+        labels={'Delivery Network Group': 'Delivery Network', 'Volume': 'Volume'},
+        height=500
+    )
+
+    fig2 = px.bar(
+        melted_df[melted_df['Volume Type'] == 'Water (BB6)'],
+        x='Delivery Network Group',
+        y='Volume',
+        title='Water Volume (BB6) by Delivery Network Group',
+        labels={'Delivery Network Group': 'Delivery Network', 'Volume': 'Volume (BB6)'},
+        height=400,
+        color_discrete_sequence=['#FF7300']
+    )
+
+    return fig1, fig2
+
+
+def build_single_volume_figures(delivery_network_df, volume_type):
+    column_name = volume_type
+    sorted_df = delivery_network_df.sort_values(by=column_name, ascending=False)
+
+    fig = px.bar(
+        sorted_df,
+        x='Delivery Network Group',
+        y=column_name,
+        title=f'{volume_type} by Delivery Network Group',
+        labels={'Delivery Network Group': 'Delivery Network'},
+        height=600,
+        color=column_name,
+        color_continuous_scale='Viridis'
+    )
+
+    # Create a well count summary chart
+    well_counts = pd.melt(
+        sorted_df,
+        id_vars=['Delivery Network Group'],
+        value_vars=['Flowing Wells', 'Non-Flowing Wells'],
+        var_name='Well Status',
+        value_name='Count'
+    )
+
+    fig_wells = px.bar(
+        well_counts,
+        x='Delivery Network Group',
+        y='Count',
+        color='Well Status',
+        title='Well Status by Delivery Network',
+        labels={'Delivery Network Group': 'Delivery Network'},
+        height=600,
+        barmode='stack'
+    )
+    fig_wells.update_layout(xaxis_tickangle=45)
+
+    return fig, fig_wells
+
+
+def render():
+    version = data_version()
+    delivery_network_df = load_delivery_network_data(version)
+
+    st.header("Standard Volume by Delivery Network Group")
+
+    # Volume type selection
+    volume_type = st.selectbox(
+        "Select Volume Type",
+        ["Gas (KCM)", "Oil (MT)", "Condensate (MT)", "Water (BB6)", "All Volumes"],
+        index=0
+    )
+
+    # Prepare data based on selection
+    if volume_type == "All Volumes":
+        fig1, fig2 = shared_cache.get_or_compute(
+            PAGE, {"volume_type": volume_type}, version,
+            lambda: build_all_volumes_figures(delivery_network_df)
+        )
+
+        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(fig2, use_container_width=True)
+
+    else:
+        # Single volume type
+        fig, fig_wells = shared_cache.get_or_compute(
+            PAGE, {"volume_type": volume_type}, version,
+            lambda: build_single_volume_figures(delivery_network_df, volume_type)
+        )
+
+        # Create two column layout
+        col1, col2 = st.columns([2, 1])
+
+        with col1:
+            st.plotly_chart(fig, use_container_width=True)
+
+        with col2:
+            st.plotly_chart(fig_wells, use_container_width=True)
+
+    # Display the data table
+    st.subheader("Data Table")
+    st.dataframe(delivery_network_df.style.highlight_max(axis=0, color='lightgreen'))
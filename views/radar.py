@@ -0,0 +1,98 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+
+from data import load_production_data, data_version
+from shared_cache import shared_cache
+
+PAGE = "Measurement Point Radar"
+
+
+# The figure is shared across sessions per selected points and data version
+def build_radar_figure(production_df, radar_metrics, point_col, selected_points):
+    fig = go.Figure()
+    np.random.seed(42)
+    for idx, point in enumerate(selected_points):
+        row = production_df[production_df[point_col] == point]
+        values = []
+        for label, col, simulate in radar_metrics:
+            if simulate:
+                # Simulate plausible value
+                if label == "Standard Volume":
+                    val = np.random.uniform(100, 1000)
+                elif label == "Density":
+                    val = np.random.uniform(0.7, 1.1)
+                elif label == "Mass":
+                    val = np.random.uniform(100, 1000)
+                elif label == "Temp":
+                    val = np.random.uniform(20, 80)
+                elif label == "BSW":
+                    val = np.random.uniform(0, 10)
+                else:
+                    val = 0
+            else:
+                val = row[col].mean()
+            values.append(val)
+        # Close the loop for radar
+        values += [values[0]]
+        labels = [m[0] for m in radar_metrics] + [radar_metrics[0][0]]
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=labels,
+            fill='toself',
+            name=str(point)
+        ))
+    fig.update_layout(
+        polar=dict(
+            radialaxis=dict(visible=True)
+        ),
+        showlegend=True,
+        title="Radar/Spider Chart per Measurement Point",
+        height=600
+    )
+
+    return fig
+
+
+def render():
+    version = data_version()
+    production_df = load_production_data(version)
+
+    st.header("Measurement Point Radar (Spider Chart)")
+
+    # Metrics to compare
+    metrics = [
+        ("Standard Volume", "Allocated Oil ProductionMT"),
+        ("Density", "Density"),
+        ("Mass", "Mass"),
+        ("Temp", "Temp"),
+        ("BSW", "BSW")
+    ]
+
+    # Check which columns exist, simulate if missing
+    available_cols = production_df.columns
+    radar_metrics = []
+    for label, col in metrics:
+        if col in available_cols:
+            radar_metrics.append((label, col, False))
+        else:
+            radar_metrics.append((label, col, True))  # True = simulate
+
+    # Get unique measurement points
+    point_col = "Process Platform/CTF"
+    points = production_df[point_col].dropna().unique()
+    selected_points = st.multiselect(
+        "Select Measurement Points",
+        points,
+        default=points[:2] if len(points) > 1 else points
+    )
+
+    if not selected_points:
+        st.warning("Please select at least one measurement point.")
+    else:
+        fig = shared_cache.get_or_compute(
+            PAGE, {"points": selected_points}, version,
+            lambda: build_radar_figure(production_df, radar_metrics, point_col, selected_points)
+        )
+        st.plotly_chart(fig, use_container_width=True)
+        st.info("This radar chart profiles each measurement point across key metrics. Outlier sites can be identified at a glance.")
@@ -0,0 +1,135 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from data import load_delivery_network_data, generate_time_series_data, select_date_range, data_version
+from shared_cache import shared_cache
+
+PAGE = "Tiled Charts"
+
+# Function to create a small chart for the tiled view
+def create_small_chart(data, network, volume_type, volume_key, height=250):
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=data['month'],
+        y=data[f"{network}_{volume_key}"],
+        mode='lines+markers',
+        name=network
+    ))
+
+    fig.update_layout(
+        title=f"{network}: {volume_type}",
+        xaxis_title=None,
+        yaxis_title=volume_type,
+        height=height,
+        margin=dict(l=10, r=10, t=40, b=20),
+        hovermode="x unified"
+    )
+
+    return fig
+
+
+# Small charts are shared across sessions per network, volume type, size,
+# date range and data version
+def cached_small_chart(data, network, volume_type, volume_key, start_date, end_date, version, height=250):
+    params = {
+        "network": network,
+        "volume_type": volume_type,
+        "height": height,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    return shared_cache.get_or_compute(
+        PAGE, params, version,
+        lambda: create_small_chart(data, network, volume_type, volume_key, height=height)
+    )
+
+
+def render():
+    version = data_version()
+    delivery_network_df = load_delivery_network_data(version)
+    start_date, end_date = select_date_range()
+
+    # Create time series data with date filtering
+    time_series_df = generate_time_series_data(delivery_network_df, start_date, end_date)
+
+    st.header(f"Tiled Charts View ({start_date.strftime('%b %Y')} - {end_date.strftime('%b %Y')})")
+
+    # Volume type selection for tiled view
+    volume_type_mapping = {
+        "Gas (KCM)": "gas",
+        "Oil (MT)": "oil",
+        "Condensate (MT)": "condensate",
+        "Water (BB6)": "water"
+    }
+
+    # Allow selecting multiple volume types for tiled view
+    selected_volume_types = st.multiselect(
+        "Select Volume Types to Display",
+        ["Gas (KCM)", "Oil (MT)", "Condensate (MT)", "Water (BB6)"],
+        default=["Gas (KCM)", "Oil (MT)"]
+    )
+
+    # Sort networks by total volume for better selection
+    network_totals = delivery_network_df.set_index('Delivery Network Group')[['Gas (KCM)', 'Oil (MT)', 'Condensate (MT)']].sum(axis=1)
+    sorted_networks = network_totals.sort_values(ascending=False, kind='stable').index.tolist()
+    default_networks = sorted_networks[:4]  # Top 4 by default
+
+    selected_networks = st.multiselect(
+        "Select Delivery Networks to Display",
+        sorted_networks,
+        default=default_networks
+    )
+
+    if not selected_volume_types:
+        st.warning("Please select at least one volume type.")
+    elif not selected_networks:
+        st.warning("Please select at least one delivery network.")
+    else:
+        # Create tiled layout
+        st.subheader("Production Metrics by Network")
+
+        # Determine grid layout based on selections
+        if len(selected_networks) == 1:
+            # Single network, multiple volume types
+            network = selected_networks[0]
+
+            # Create a row of charts for each volume type
+            for volume_type in selected_volume_types:
+                volume_key = volume_type_mapping[volume_type]
+
+                # Create chart
+                fig = cached_small_chart(time_series_df, network, volume_type, volume_key, start_date, end_date, version, height=300)
+
+                # Display chart
+                st.plotly_chart(fig, use_container_width=True)
+        else:
+            # Multiple networks
+            # For each volume type, create a row of charts
+            for volume_type in selected_volume_types:
+                st.write(f"### {volume_type}")
+                volume_key = volume_type_mapping[volume_type]
+
+                # Calculate number of columns based on network count
+                num_networks = len(selected_networks)
+                if num_networks <= 2:
+                    cols = st.columns(num_networks)
+                else:
+                    cols = st.columns(min(3, num_networks))  # Max 3 columns
+
+                # Create charts for each network
+                for i, network in enumerate(selected_networks):
+                    col_idx = i % len(cols)
+                    with cols[col_idx]:
+                        fig = cached_small_chart(time_series_df, network, volume_type, volume_key, start_date, end_date, version)
+                        st.plotly_chart(fig, use_container_width=True)
+
+    # Information about the simulated data
+    st.info("""
+        **Note**: These charts display simulated time series data based on actual production values.
+        The simulation includes seasonal patterns and random variations to illustrate potential volume changes over time.
+    """)
+
+    # Show the aggregated data for selected networks
+    st.subheader("Data Summary for Selected Networks")
+    selected_data = delivery_network_df[delivery_network_df['Delivery Network Group'].isin(selected_networks)]
+    st.dataframe(selected_data.style.highlight_max(axis=0, color='lightgreen'))
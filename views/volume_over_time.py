@@ -0,0 +1,108 @@
+import streamlit as st
+import plotly.graph_objects as go
+
+from data import load_delivery_network_data, generate_time_series_data, select_date_range, data_version
+from shared_cache import shared_cache
+
+PAGE = "Standard Volume over Time"
+
+
+# Shared across sessions per volume type, networks, date range and data version
+def build_time_series_figure(time_series_df, selected_networks, volume_type, volume_key):
+    fig = go.Figure()
+
+    for network in selected_networks:
+        fig.add_trace(go.Scatter(
+            x=time_series_df['month'],
+            y=time_series_df[f"{network}_{volume_key}"],
+            mode='lines+markers',
+            name=network
+        ))
+
+    fig.update_layout(
+        title=f"{volume_type} over Time by Delivery Network",
+        xaxis_title="Month",
+        yaxis_title=volume_type,
+        hovermode="x unified",
+        height=600
+    )
+
+    return fig
+
+
+def render():
+    version = data_version()
+    delivery_network_df = load_delivery_network_data(version)
+    start_date, end_date = select_date_range()
+
+    # Create time series data with date filtering
+    time_series_df = generate_time_series_data(delivery_network_df, start_date, end_date)
+
+    st.header(f"Standard Volume over Time ({start_date.strftime('%b %Y')} - {end_date.strftime('%b %Y')})")
+
+    # Volume type selection
+    volume_type_mapping = {
+        "Gas (KCM)": "gas",
+        "Oil (MT)": "oil",
+        "Condensate (MT)": "condensate",
+        "Water (BB6)": "water"
+    }
+
+    volume_type = st.selectbox(
+        "Select Volume Type",
+        ["Gas (KCM)", "Oil (MT)", "Condensate (MT)", "Water (BB6)"],
+        index=0
+    )
+
+    volume_key = volume_type_mapping[volume_type]
+
+    # Network selection (multi-select)
+    all_networks = delivery_network_df['Delivery Network Group'].tolist()
+    default_networks = all_networks[:3]  # Top 3 by default
+
+    selected_networks = st.multiselect(
+        "Select Delivery Networks to Compare",
+        all_networks,
+        default=default_networks
+    )
+
+    if not selected_networks:
+        st.warning("Please select at least one delivery network.")
+    else:
+        # Prepare data for the selected networks
+        params = {
+            "volume_type": volume_type,
+            "networks": selected_networks,
+            "start_date": start_date,
+            "end_date": end_date,
+        }
+        fig = shared_cache.get_or_compute(
+            PAGE, params, version,
+            lambda: build_time_series_figure(time_series_df, selected_networks, volume_type, volume_key)
+        )
+
+        st.plotly_chart(fig, use_container_width=True)
+
+        # Information about the simulated data
+        st.info("""
+            **Note**: This chart displays simulated time series data based on actual production values.
+            The simulation includes seasonal patterns and random variations to illustrate potential volume changes over time.
+        """)
+
+        # Show the aggregated data for selected networks
+        st.subheader("Data for Selected Networks")
+        selected_data = delivery_network_df[delivery_network_df['Delivery Network Group'].isin(selected_networks)]
+        st.dataframe(selected_data)
+
+        # Add download button for time series data
+        st.subheader("Download Time Series Data")
+        csv = shared_cache.get_or_compute(
+            PAGE, {"csv": True, "start_date": start_date, "end_date": end_date}, version,
+            lambda: time_series_df.to_csv(index=False)
+        )
+        st.download_button(
+            label="Download CSV",
+            data=csv,
+            file_name=f"production_data_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
@@ -0,0 +1,89 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.express as px
+
+from shared_cache import shared_cache
+
+PAGE = "Well Status Map"
+
+
+# Built once per process and shared across sessions
+def build_well_map_figure():
+    # Generate mock well data
+    np.random.seed(42)
+    num_wells = 20
+    # Example: random lat/lon within a plausible oilfield region (e.g., Mumbai Offshore)
+    latitudes = np.random.uniform(18.5, 19.5, num_wells)
+    longitudes = np.random.uniform(71.0, 73.0, num_wells)
+    statuses = np.random.choice(["Active", "Inactive", "Shut-in"], num_wells, p=[0.6, 0.3, 0.1])
+    well_ids = [f"WELL-{i+1:03d}" for i in range(num_wells)]
+    # Simulate volume (1-10)
+    volumes = np.random.randint(1, 11, num_wells)
+
+    well_df = pd.DataFrame({
+        "Well Id": well_ids,
+        "Latitude": latitudes,
+        "Longitude": longitudes,
+        "Status": statuses,
+        "Volume": volumes
+    })
+
+    # For each well, create multiple dots according to volume (with jitter)
+    emoji = "🛢️"
+    expanded_rows = []
+    for _, row in well_df.iterrows():
+        for i in range(row["Volume"]):
+            jitter_lat = row["Latitude"] + i*0.03
+            jitter_lon = row["Longitude"] #+ np.random.uniform(-0.01, 0.01)
+            expanded_rows.append({
+                "Well Id": row["Well Id"],
+                "Latitude": jitter_lat,
+                "Longitude": jitter_lon,
+                "Status": row["Status"],
+                "Volume": row["Volume"],
+                "Emoji": emoji
+            })
+    plot_df = pd.DataFrame(expanded_rows)
+
+    # Map color for status
+    status_color_map = {
+        "Active": "green",
+        "Inactive": "red",
+        "Shut-in": "orange"
+    }
+    plot_df["Color"] = plot_df["Status"].map(status_color_map)
+
+    # Plotly scatter_mapbox with bigger dots and emoji as text
+    fig_map = px.scatter_mapbox(
+        plot_df,
+        lat="Latitude",
+        lon="Longitude",
+        color="Status",
+        hover_name="Well Id",
+        hover_data={"Latitude": True, "Longitude": True, "Status": True, "Volume": True},
+        zoom=7,
+        height=700,
+        color_discrete_map=status_color_map,
+        title="Well Status Map",
+        text="Emoji",
+        size_max=30
+    )
+    fig_map.update_traces(marker=dict(size=7, sizemode="diameter"), textfont_size=24)
+    fig_map.update_layout(
+        mapbox_style="open-street-map",
+        margin={"r":0,"t":40,"l":0,"b":0}
+    )
+
+    return fig_map
+
+
+def render():
+    st.header("Well Status Map")
+
+    # Mock data only, so the figure does not depend on the data version
+    fig_map = shared_cache.get_or_compute(PAGE, {}, None, build_well_map_figure)
+
+    st.plotly_chart(fig_map, use_container_width=True)
+
+    st.info("This map displays well locations and status. Each 🛢️ represents a well, and more dots indicate higher volume. Replace with actual well coordinates, status, and volume for real data.")
